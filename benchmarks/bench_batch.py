@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+QBET Batch Runner Benchmark
+Runs copies of a universe as one `qb run` process per file and as a single
+batch run on warm workers.
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+QB = str(QBET_ROOT / "qb")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the QBET batch runner')
+    parser.add_argument('--files', type=int, default=50, help='Copies of the source universe')
+    parser.add_argument('--jobs', type=int, default=0, help='Batch workers (0: one per CPU)')
+    parser.add_argument('--source', default=str(QBET_ROOT / "universes/index.qbet"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(args.files):
+            path = Path(tmp) / f"universe_{i:05d}.qbet"
+            shutil.copyfile(args.source, path)
+            files.append(str(path))
+
+        start = time.perf_counter()
+        for path in files:
+            subprocess.run([QB, "run", path, "--quiet"], check=True)
+        separate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = subprocess.run([QB, "run", tmp, "--quiet", "--jobs", str(args.jobs)],
+                                stdout=subprocess.DEVNULL)
+        batch = time.perf_counter() - start
+
+    if result.returncode != 0:
+        print("❌ Batch run reported failures")
+        return 1
+    print(f"{args.files} processes: {separate * 1000:>9.1f} ms")
+    print(f"one batch:    {batch * 1000:>9.1f} ms ({separate / batch:.1f}x)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
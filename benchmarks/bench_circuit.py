@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+QBET Lazy Circuit Benchmark
+Runs a gate-heavy script through the quantum stdlib eagerly and in lazy
+mode (lazy_gates), checks that the final states agree, and reports the time of
+each. Requires NumPy.
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+import numpy as np
+
+from stdlib.quantum import setup_quantum_functions
+from environment import Environment
+
+GATES = ['hadamard', 'pauli_x', 'pauli_y', 'pauli_z']
+
+def script(size, depth, seed):
+    """Layers of random single-qubit gates, a CNOT ladder every 8 layers"""
+    rng = random.Random(seed)
+    steps = []
+    for layer in range(depth):
+        for k in range(size):
+            steps.append((rng.choice(GATES), k))
+        if layer % 8 == 7:
+            steps.extend(('cnot', k) for k in range(size - 1))
+    return steps
+
+def run(steps, size, lazy):
+    env = Environment()
+    setup_quantum_functions(env)
+    q = env.variables
+    q['lazy_gates'](lazy)
+    register = q['register'](size, 'dense')
+    qubits = [register.qubit(k) for k in range(size)]
+    start = time.perf_counter()
+    for name, k in steps:
+        if name == 'cnot':
+            q['cnot'](qubits[k], qubits[k + 1])
+        else:
+            q[name](qubits[k])
+    q['run_circuit']()
+    return time.perf_counter() - start, register
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark lazy gate fusion')
+    parser.add_argument('--qubits', type=int, default=16, help='Register size')
+    parser.add_argument('--depth', type=int, default=64, help='Gate layers')
+    parser.add_argument('--seed', type=int, default=0, help='Script seed')
+    args = parser.parse_args()
+
+    steps = script(args.qubits, args.depth, args.seed)
+    gates = sum(name != 'cnot' for name, _ in steps)
+    eager, reference = run(steps, args.qubits, False)
+    lazy, register = run(steps, args.qubits, True)
+
+    print(f"{args.qubits} qubits, {gates} single-qubit gates, "
+          f"{len(steps) - gates} CNOTs")
+    print(f"eager: {eager * 1000:9.1f} ms")
+    print(f"lazy:  {lazy * 1000:9.1f} ms ({eager / lazy:.1f}x)")
+    if not np.allclose(register.state, reference.state):
+        print("❌ lazy result differs from eager")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
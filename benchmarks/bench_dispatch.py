@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+QBET Visitor Dispatch Micro-benchmark
+Per-node cost of Interpreter.execute for every AST node type, against the
+former f-string + getattr lookup. New ast_nodes classes are picked up
+automatically.
+"""
+
+import sys
+import time
+import inspect
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+import ast_nodes
+from interpreter import Interpreter
+
+class GetattrInterpreter(Interpreter):
+    """Dispatch as it was before the cached table"""
+
+    def execute(self, node):
+        method_name = f'visit_{type(node).__name__}'
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+
+def node_types():
+    return [cls for _, cls in inspect.getmembers(ast_nodes, inspect.isclass)
+            if issubclass(cls, ast_nodes.ASTNode) and cls is not ast_nodes.ASTNode]
+
+def stubbed(base):
+    """Subclass of `base` whose visitors return immediately, isolating dispatch"""
+    noop = lambda self, node: None
+    visitors = {f'visit_{node_type.__name__}': noop for node_type in node_types()}
+    return type(f'Stub{base.__name__}', (base,), visitors)
+
+def dispatch_ns(interpreter, node, calls):
+    execute = interpreter.execute
+    execute(node)  # Warm the dispatch table
+    start = time.perf_counter()
+    for _ in range(calls):
+        execute(node)
+    return (time.perf_counter() - start) / calls * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Interpreter visitor dispatch')
+    parser.add_argument('--calls', type=int, default=200000, help='Dispatches per node type')
+    parser.add_argument('--budget-ns', type=float, default=None,
+                        help='Fail if cached dispatch exceeds this many ns for any node type')
+    args = parser.parse_args()
+
+    cached, legacy = stubbed(Interpreter)(), stubbed(GetattrInterpreter)()
+    status = 0
+    print(f"{'node':<22} {'getattr (ns)':>13} {'table (ns)':>11}")
+    for node_type in node_types():
+        node = node_type.__new__(node_type)
+        old = dispatch_ns(legacy, node, args.calls)
+        new = dispatch_ns(cached, node, args.calls)
+        flag = ""
+        if args.budget_ns is not None and new > args.budget_ns:
+            flag = "  ❌ over budget"
+            status = 1
+        print(f"{node_type.__name__:<22} {old:>13.1f} {new:>11.1f}{flag}")
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+QBET Lexer Benchmark
+Compares the regex lexer against the reference character scanner.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from lexer import Lexer, ScanLexer
+
+def build_corpus(lines):
+    """Repeat the bundled .qbet sources until the corpus has `lines` lines"""
+    sources = []
+    for pattern in ("universes/*.qbet", "examples/*.qbet", "std/*.qbet"):
+        for path in sorted(QBET_ROOT.glob(pattern)):
+            sources.append(path.read_text(encoding='utf-8'))
+    unit = "\n".join(sources) + "\n"
+    repeat = max(1, lines // unit.count("\n"))
+    return unit * repeat
+
+def best_of(lexer_class, source, rounds):
+    best = float("inf")
+    tokens = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        tokens = lexer_class(source).tokenize()
+        best = min(best, time.perf_counter() - start)
+    return best, tokens
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the QBET lexer engines')
+    parser.add_argument('--lines', type=int, default=200000, help='Corpus size in lines')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed rounds per engine')
+    args = parser.parse_args()
+
+    source = build_corpus(args.lines)
+    print(f"Corpus: {source.count(chr(10))} lines, {len(source)} chars")
+
+    scan_time, scan_tokens = best_of(ScanLexer, source, args.rounds)
+    regex_time, regex_tokens = best_of(Lexer, source, args.rounds)
+
+    expected = [(t.type, t.value, t.line) for t in scan_tokens]
+    actual = [(t.type, t.value, t.line) for t in regex_tokens]
+    if expected != actual:
+        print("❌ Token streams differ")
+        return 1
+
+    print(f"  scan   {scan_time * 1000:10.1f} ms  ({len(scan_tokens)} tokens)")
+    print(f"  regex  {regex_time * 1000:10.1f} ms  ({len(regex_tokens)} tokens)")
+    print(f"  speedup {scan_time / regex_time:.2f}x")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+QBET MPS Benchmark
+Runs a brickwork circuit of random single-qubit rotations and
+nearest-neighbour CNOTs on a wide MPS register for several bond caps, and
+reports time, largest bond, truncation error and estimated fidelity.
+Requires NumPy.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+import numpy as np
+
+from stdlib.mps import MPS
+
+def rotations(size, depth, seed):
+    """Random 2x2 unitaries, one per qubit per layer"""
+    rng = np.random.default_rng(seed)
+    z = rng.normal(size=(depth, size, 2, 2)) + 1j * rng.normal(size=(depth, size, 2, 2))
+    return np.linalg.qr(z)[0]
+
+def brickwork(register, layers):
+    for depth, layer in enumerate(layers):
+        for k, u in enumerate(layer):
+            register.apply(u, k)
+        for k in range(depth % 2, register.size - 1, 2):
+            register.cnot(k, k + 1)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the MPS register')
+    parser.add_argument('--qubits', type=int, default=128, help='Register size')
+    parser.add_argument('--depth', type=int, default=12, help='Brickwork layers')
+    parser.add_argument('--bonds', default='8,32,128', help='Comma-separated bond caps')
+    parser.add_argument('--shots', type=int, default=1000, help='Shots sampled at the end')
+    parser.add_argument('--seed', type=int, default=0, help='Circuit seed')
+    args = parser.parse_args()
+
+    layers = rotations(args.qubits, args.depth, args.seed)
+    print(f"{args.qubits} qubits, depth {args.depth}")
+    print(f"{'max bond':>8} {'time (ms)':>10} {'sample (ms)':>12} {'bond':>5} "
+          f"{'truncation':>11} {'fidelity':>9}")
+    for cap in map(int, args.bonds.split(',')):
+        register = MPS(args.qubits, max_bond=cap, rng=np.random.default_rng(args.seed))
+        start = time.perf_counter()
+        brickwork(register, layers)
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        register.sample(args.shots)
+        sampled = time.perf_counter() - start
+        print(f"{cap:>8} {elapsed * 1000:>10.1f} {sampled * 1000:>12.1f} "
+              f"{max(register.bonds()):>5} {register.truncation:>11.2e} {register.fidelity:>9.4f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+QBET Quantum Register Benchmark
+Runs the same circuits on the dense (StateVector), sparse (SparseState) and
+MPS registers, checks that they agree, and reports time and stored
+amplitudes.
+Requires NumPy.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+import numpy as np
+
+from stdlib.statevector import StateVector
+from stdlib.sparse import SparseState
+from stdlib.mps import MPS
+
+def basis_logic(register, size):
+    """X/CNOT ripple with a single Hadamard: two non-zero amplitudes"""
+    register.apply('h', 0)
+    for _ in range(4):
+        for k in range(0, size, 3):
+            register.apply('x', k)
+        for k in range(size - 1):
+            register.cnot(k, k + 1)
+        register.apply('z', size - 1)
+
+def few_hadamards(register, size):
+    """Basis logic over a 2^4-term superposition"""
+    for k in range(4):
+        register.apply('h', k)
+    basis_logic(register, size)
+
+def hadamard_layer(register, size):
+    """Uniform superposition: every amplitude non-zero"""
+    for k in range(size):
+        register.apply('h', k)
+    for k in range(size - 1):
+        register.cnot(k, k + 1)
+
+CIRCUITS = {
+    "basis-logic": basis_logic,
+    "few-hadamards": few_hadamards,
+    "hadamard-layer": hadamard_layer,
+}
+
+BACKENDS = {
+    "dense": StateVector,
+    "sparse": lambda size: SparseState(size, threshold=float('inf')),
+    "adaptive": SparseState,
+    "mps": MPS,
+}
+
+def stored(register):
+    """Amplitudes the register holds in memory"""
+    if isinstance(register, SparseState) and register.dense is None:
+        return len(register.terms)
+    if isinstance(register, MPS):
+        return sum(tensor.size for tensor in register.tensors)
+    return 1 << register.size
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dense vs sparse quantum registers')
+    parser.add_argument('--qubits', type=int, default=20, help='Register size')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed rounds per backend')
+    args = parser.parse_args()
+
+    status = 0
+    print(f"{'circuit':<16} {'backend':<9} {'time (ms)':>10} {'amplitudes':>11}")
+    for name, circuit in CIRCUITS.items():
+        reference = None
+        for backend, make in BACKENDS.items():
+            best = float("inf")
+            for _ in range(args.rounds):
+                register = make(args.qubits)
+                start = time.perf_counter()
+                circuit(register, args.qubits)
+                best = min(best, time.perf_counter() - start)
+            state = register.amplitudes()
+            if reference is None:
+                reference = state.copy()
+            flag = ""
+            if not np.allclose(state, reference):
+                flag = "  ❌ differs from dense"
+                status = 1
+            print(f"{name:<16} {backend:<9} {best * 1000:>10.2f} {stored(register):>11}{flag}")
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+QBET Qubit Ensemble Benchmark
+Applies the same gate sequence to N independent qubits held as a list of
+Qubit objects and as one QubitArray, checks that the probabilities agree,
+and reports time and memory per qubit. Requires NumPy.
+"""
+
+import sys
+import time
+import tracemalloc
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+import numpy as np
+
+from stdlib.quantum import setup_quantum_functions
+from environment import Environment
+from qbet_types import Qubit
+
+SEQUENCE = ['hadamard', 'pauli_y', 'pauli_z', 'hadamard', 'pauli_x', 'hadamard']
+
+def objects(q, count):
+    qubits = [Qubit() for _ in range(count)]
+    for gate in SEQUENCE:
+        for qubit in qubits:
+            q[gate](qubit)
+    return np.array([q['prob_one'](qubit).value for qubit in qubits])
+
+def array(q, count):
+    qubits = q['qubit_array'](count)
+    for gate in SEQUENCE:
+        q[gate](qubits)
+    return q['prob_one'](qubits).value
+
+def measure(run, q, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run(q, count)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Qubit objects vs QubitArray')
+    parser.add_argument('--qubits', type=int, default=200_000, help='Ensemble size')
+    args = parser.parse_args()
+
+    env = Environment()
+    setup_quantum_functions(env)
+    q = env.variables
+
+    status = 0
+    reference = None
+    for name, run in (("Qubit list", objects), ("QubitArray", array)):
+        elapsed, peak, result = measure(run, q, args.qubits)
+        if reference is None:
+            reference = result
+        flag = ""
+        if not np.allclose(result, reference):
+            flag = "  ❌ differs from Qubit list"
+            status = 1
+        print(f"{name:<11} {elapsed * 1000:9.1f} ms {peak / args.qubits:8.1f} B/qubit{flag}")
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+QBET IR Reader Benchmark
+Times QBReader on a generated .qb file and checks that every chunk size,
+however small, decodes the same document as json.load.
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from ir import QBReader, write_qb
+
+# Numbers of every JSON shape, so some always straddle a chunk boundary
+VALUES = [12345.678, -5e10, 1.5, 0, -0.25, 7, 1e-7, 31415926535, "x", True, None]
+
+def instructions(count):
+    for i in range(count):
+        yield {"t": "state", "v": [f"s{i}", VALUES[i % len(VALUES)], [i, -i * 0.5]]}
+
+def read(path, chunk_size):
+    with QBReader(path, chunk_size=chunk_size) as reader:
+        body = list(reader)
+        return {**reader.header, "instructions": body}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the incremental .qb reader')
+    parser.add_argument('--instructions', type=int, default=100000, help='Instructions in the timed file')
+    parser.add_argument('--max-chunk', type=int, default=64, help='Largest chunk size in the round-trip check')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        small = Path(tmp) / "small.qb"
+        with open(small, "w", encoding="utf-8") as f:
+            write_qb(f, instructions(len(VALUES) * 3), 1.5, "small.qbet")
+        expected = json.loads(small.read_text(encoding="utf-8"))
+        for chunk_size in range(1, args.max_chunk + 1):
+            try:
+                actual = read(small, chunk_size)
+            except ValueError as e:
+                print(f"❌ chunk size {chunk_size}: {e}")
+                return 1
+            if actual != expected:
+                print(f"❌ chunk size {chunk_size} decodes a different document")
+                return 1
+        print(f"Round trip OK for chunk sizes 1-{args.max_chunk}")
+
+        large = Path(tmp) / "large.qb"
+        with open(large, "w", encoding="utf-8") as f:
+            write_qb(f, instructions(args.instructions), 1.5, "large.qbet")
+        start = time.perf_counter()
+        expected = json.loads(large.read_text(encoding="utf-8"))
+        loaded = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = read(large, QBReader.CHUNK_SIZE)
+        streamed = time.perf_counter() - start
+        if actual != expected:
+            print("❌ QBReader and json.load disagree")
+            return 1
+        print(f"  json.load  {loaded * 1000:10.1f} ms")
+        print(f"  QBReader   {streamed * 1000:10.1f} ms  ({args.instructions} instructions)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+QBET Sampling Benchmark
+Compares collecting measurement statistics shot by shot (copy the state,
+measure every qubit) with one vectorized sample() call. Requires NumPy.
+"""
+
+import sys
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from stdlib.statevector import StateVector
+
+def prepare(size):
+    """GHZ-like state with a few extra superposed qubits"""
+    register = StateVector(size)
+    register.apply('h', 0)
+    for k in range(size - 1):
+        register.cnot(k, k + 1)
+    for k in range(0, size, 4):
+        register.apply('h', k)
+    return register
+
+def shot_by_shot(register, shots):
+    counts = Counter()
+    original = register.state.copy()
+    for _ in range(shots):
+        register.state[...] = original
+        bits = [register.measure(k) for k in reversed(range(register.size))]
+        counts["".join(map(str, bits))] += 1
+    register.state[...] = original
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-shot sampling')
+    parser.add_argument('--qubits', type=int, default=12, help='Register size')
+    parser.add_argument('--shots', type=int, default=2000, help='Shots for the per-shot loop')
+    parser.add_argument('--vector-shots', type=int, default=1_000_000, help='Shots for sample()')
+    args = parser.parse_args()
+
+    register = prepare(args.qubits)
+
+    start = time.perf_counter()
+    shot_by_shot(register, args.shots)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = register.sample(args.vector_shots)
+    vector = time.perf_counter() - start
+
+    print(f"measure loop: {args.shots:>9} shots in {loop * 1000:9.1f} ms "
+          f"({args.shots / loop:,.0f} shots/s)")
+    print(f"sample():     {args.vector_shots:>9} shots in {vector * 1000:9.1f} ms "
+          f"({args.vector_shots / vector:,.0f} shots/s)")
+    if sum(counts.values()) != args.vector_shots:
+        print("❌ sample() lost shots")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
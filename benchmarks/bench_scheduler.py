@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+QBET Scheduler Benchmark
+Runs a synthetic multiverse of unrelated universes serially and on the
+process pool, checking that both produce the same events in the same order.
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from scheduler import Scheduler, components
+from runtime.events import RecordingSink
+
+def multiverse(count):
+    """`count` independent universe/entity/manifest/observe subgraphs"""
+    instructions = []
+    for i in range(count):
+        universe, entity = f"U{i}", f"E{i}"
+        instructions += [
+            {"t": "UNIVERSE", "v": [universe, {"law": ["quantum"], "port": str(1000 + i)}]},
+            {"t": "ENTITY", "v": [entity, {"role": "observer"}]},
+            {"t": "MANIFEST", "v": [universe, entity]},
+            {"t": "FLOW_TIME", "v": "forward"},
+            {"t": "OBSERVE", "v": universe},
+        ]
+    return instructions
+
+def timed(jobs, instructions):
+    sink = RecordingSink()
+    start = time.perf_counter()
+    Scheduler(jobs, sink).run(instructions)
+    return time.perf_counter() - start, sink.take()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the QBET parallel scheduler')
+    parser.add_argument('--universes', type=int, default=20000, help='Independent universes')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Worker processes')
+    args = parser.parse_args()
+
+    instructions = multiverse(args.universes)
+    print(f"{len(instructions)} instructions in {len(components(instructions))} components")
+    serial_time, serial_events = timed(1, instructions)
+    parallel_time, parallel_events = timed(args.jobs, instructions)
+    if serial_events != parallel_events:
+        print("❌ Parallel events differ from the serial run")
+        return 1
+    print(f"serial:            {serial_time * 1000:>9.1f} ms")
+    print(f"{args.jobs:>2} jobs:           {parallel_time * 1000:>9.1f} ms "
+          f"({serial_time / parallel_time:.2f}x)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
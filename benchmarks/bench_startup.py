@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+QBET CLI Startup Benchmark
+Best-of-N wall time of light `qb` subcommands, and a check that they do not
+import the execution pipeline. Exits nonzero when a command is over
+--budget-ms or imports a pipeline module.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from startup import measure
+
+COMMANDS = [["version"], ["doctor"], ["observe"], ["--version"]]
+
+# Default --budget-ms: a few times a light command's cold start, so a slow
+# machine passes but pulling the pipeline back in does not
+BUDGET_MS = 150.0
+
+# Modules only the subcommands that execute programs may load
+PIPELINE = {"lexer", "parser", "interpreter", "lowerer", "repl", "ir", "qbc",
+            "ircache", "scheduler", "batch", "daemon", "stdlib", "json",
+            "concurrent.futures"}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark qb CLI startup')
+    parser.add_argument('--rounds', type=int, default=5, help='Runs per command')
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS,
+                        help=f'Fail if any command takes longer than this (best of rounds; default {BUDGET_MS:g})')
+    args = parser.parse_args()
+
+    status = 0
+    print(f"{'command':<14} {'best (ms)':>10} {'imports':>8}")
+    for argv in COMMANDS:
+        runs = [measure(argv) for _ in range(args.rounds)]
+        best = min(wall for wall, _, _ in runs)
+        imports = runs[0][2]
+        flags = []
+        loaded = sorted(PIPELINE & {name for name, _, _, _ in imports})
+        if loaded:
+            flags.append(f"imports {', '.join(loaded)}")
+        if best * 1000 > args.budget_ms:
+            flags.append("over budget")
+        print(f"{' '.join(argv):<14} {best * 1000:>10.1f} {len(imports):>8}"
+              + (f"  ❌ {'; '.join(flags)}" if flags else ""))
+        status |= bool(flags)
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
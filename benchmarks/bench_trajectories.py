@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+QBET Noise Trajectory Benchmark
+Runs noisy GHZ-circuit trajectories serially and on a process pool,
+checks that a seed gives the same counts for any number of workers, and
+reports trajectories per second.
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from trajectories import TrajectoryRunner
+from stdlib.noise import NoiseModel
+
+QUBITS = 10
+
+def ghz(quantum):
+    """GHZ state on a sparse register, measured qubit by qubit"""
+    register = quantum['register'](QUBITS, 'sparse')
+    qubits = [register.qubit(k) for k in range(QUBITS)]
+    quantum['hadamard'](qubits[0])
+    for k in range(QUBITS - 1):
+        quantum['cnot'](qubits[k], qubits[k + 1])
+    return "".join(str(int(quantum['measure'](qubit).value)) for qubit in reversed(qubits))
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parallel noise trajectories')
+    parser.add_argument('--trajectories', type=int, default=5000, help='Trajectories per run')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('--depolarizing', type=float, default=0.01, help='Depolarizing probability')
+    parser.add_argument('--damping', type=float, default=0.01, help='Amplitude damping rate')
+    parser.add_argument('--seed', type=int, default=0, help='Root seed')
+    args = parser.parse_args()
+
+    noise = NoiseModel(depolarizing=args.depolarizing, damping=args.damping)
+    results = {}
+    for jobs in sorted({1, args.jobs}):
+        runner = TrajectoryRunner(noise, jobs=jobs, seed=args.seed)
+        start = time.perf_counter()
+        results[jobs] = runner.run(ghz, args.trajectories)
+        elapsed = time.perf_counter() - start
+        print(f"jobs={jobs:<3} {elapsed * 1000:9.1f} ms "
+              f"({args.trajectories / elapsed:,.0f} trajectories/s)")
+
+    counts = results[1]
+    ideal = counts.get("0" * QUBITS, 0) + counts.get("1" * QUBITS, 0)
+    print(f"GHZ outcomes: {ideal / args.trajectories:.1%} of {len(counts)} distinct")
+    if len({tuple(r.items()) for r in results.values()}) != 1:
+        print("❌ counts depend on the number of workers")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
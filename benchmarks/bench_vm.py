@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+QBET VM Benchmark
+Compares the bytecode VM against the AST tree walker on the example programs.
+"""
+
+import io
+import sys
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+QBET_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(QBET_ROOT / "kernel"))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+from compiler import Compiler
+from vm import VM
+from environment import Frame
+
+SYNTHETIC = {
+    # Output-bound: every cycle observes and prints
+    "synthetic-observe": """
+state reality = "stabilized"
+state entropy = 0.0042
+quantum psi = 0.7071
+print entropy
+print "--- cycle ---"
+observe reality
+observe psi
+link psi reality
+""",
+    # State-bound: bindings and lookups, one line of output per cycle
+    "synthetic-state": """
+state reality = "stabilized"
+state entropy = 0.0042
+state coherence = entropy
+quantum psi = coherence
+quantum phi = psi
+state anchor = phi
+state field = reality
+state echo = field
+print echo
+""",
+}
+
+# Local-bound: each call's reads and writes go to its resolved frame slots
+FUNCTION = """
+function cycle() {
+  state energy = 0.0042
+  state level = energy
+  quantum psi = level
+  state anchor = psi
+  observe anchor
+}
+"""
+
+def load_programs(repeat):
+    """Example programs the parser accepts, plus a synthetic straight-line one"""
+    programs = {}
+    for pattern in ("examples/*.qbet", "universes/*.qbet"):
+        for path in sorted(QBET_ROOT.glob(pattern)):
+            try:
+                tokens = Lexer(path.read_text(encoding='utf-8')).tokenize()
+                programs[path.name] = Parser(tokens).parse()
+            except Exception:
+                continue
+    for name, source in SYNTHETIC.items():
+        programs[name] = Parser(Lexer(source * repeat).tokenize()).parse()
+    source = FUNCTION + "cycle()\n" * repeat
+    programs["synthetic-function"] = Parser(Lexer(source).tokenize()).parse()
+    return programs
+
+def frame_accesses(program):
+    """(gets, sets) of Frame slots while the tree walker runs `program`"""
+    counts = [0, 0]
+    get, set_ = Frame.get, Frame.set
+    def counted_get(frame, depth, slot):
+        counts[0] += 1
+        return get(frame, depth, slot)
+    def counted_set(frame, depth, slot, value):
+        counts[1] += 1
+        set_(frame, depth, slot, value)
+    Frame.get, Frame.set = counted_get, counted_set
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            Interpreter().execute(program)
+    finally:
+        Frame.get, Frame.set = get, set_
+    return tuple(counts)
+
+def timed(engine, run, rounds):
+    """Best-of-`rounds` time of run(engine()); construction is not timed"""
+    best = float("inf")
+    for _ in range(rounds):
+        instance = engine()
+        sink = io.StringIO()
+        with contextlib.redirect_stdout(sink):
+            start = time.perf_counter()
+            run(instance)
+            best = min(best, time.perf_counter() - start)
+    return best, sink.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the QBET bytecode VM')
+    parser.add_argument('--repeat', type=int, default=20000, help='Synthetic program size in cycles')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per engine')
+    args = parser.parse_args()
+
+    status = 0
+    print(f"{'program':<24} {'tree (ms)':>10} {'vm (ms)':>10} {'compile (ms)':>13} {'speedup':>8}")
+    for name, program in load_programs(args.repeat).items():
+        start = time.perf_counter()
+        code = Compiler().compile(program)
+        compile_time = time.perf_counter() - start
+
+        tree_time, tree_out = timed(Interpreter, lambda tree: tree.execute(program), args.rounds)
+        vm_time, vm_out = timed(VM, lambda vm: vm.run(code), args.rounds)
+        if tree_out != vm_out:
+            print(f"❌ {name}: VM output differs from the tree walker")
+            status = 1
+            continue
+        speedup = tree_time / vm_time if vm_time else float("inf")
+        print(f"{name:<24} {tree_time * 1000:>10.2f} {vm_time * 1000:>10.2f} "
+              f"{compile_time * 1000:>13.2f} {speedup:>7.2f}x")
+
+    # Function locals must be read and written through frame slots
+    check = Parser(Lexer(FUNCTION + "cycle()\n").tokenize()).parse()
+    if frame_accesses(check) != (4, 4):
+        print("❌ function locals bypass their Frame slots")
+        status = 1
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
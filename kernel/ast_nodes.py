@@ -32,6 +32,8 @@ class Identifier(ASTNode):
     """Variable or function name"""
     def __init__(self, name):
         self.name = name
+        self.depth = None   # Lexical address, filled in by the Resolver
+        self.slot = None
 
 class BinaryOp(ASTNode):
     """Binary operation (e.g., a + b)"""
@@ -51,6 +53,8 @@ class Assignment(ASTNode):
     def __init__(self, name, value):
         self.name = name
         self.value = value
+        self.depth = None   # Lexical address, filled in by the Resolver
+        self.slot = None
 
 class FunctionCall(ASTNode):
     """Function call"""
@@ -88,6 +92,7 @@ class Program(ASTNode):
     """Root node containing all statements"""
     def __init__(self, statements):
         self.statements = statements
+        self.resolved = False
 
 class ExpressionStatement(ASTNode):
     """Statement that is just an expression"""
@@ -125,6 +130,7 @@ class FunctionDeclaration(ASTNode):
         self.name = name
         self.parameters = parameters
         self.body = body
+        self.frame_size = None  # Number of local slots, set by the Resolver
 
 class ReturnStatement(ASTNode):
     """Return statement"""
@@ -156,6 +162,8 @@ class Measurement(ASTNode):
     """Measure a qubit"""
     def __init__(self, qubit):
         self.qubit = qubit
+        self.depth = None   # Lexical address, filled in by the Resolver
+        self.slot = None
 
 class Superposition(ASTNode):
     """Put qubit in superposition"""
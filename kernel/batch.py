@@ -0,0 +1,100 @@
+"""
+QBET Batch Runner
+Executes many files on a pool of warm worker processes and reports
+aggregate results.
+"""
+
+import os
+import glob
+import time
+from pathlib import Path
+
+from runtime.events import RecordingSink, NullSink
+
+SOURCE_SUFFIXES = ('.qbet', '.qb', '.qbc')
+
+def expand(patterns):
+    """Files named by paths, directories (searched recursively) and globs.
+
+    Each argument's matches are sorted; duplicates keep their first position.
+    A path that matches nothing is kept so that running it reports the error.
+    """
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(str(p) for p in path.rglob('*') if p.suffix in SOURCE_SUFFIXES)
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern]
+        files.extend(matches)
+    return list(dict.fromkeys(files))
+
+# Per-process state, created by init_worker
+worker = None
+record = True
+options = {}
+
+def init_worker(record_output=True, run_options=None):
+    """Warm a worker: import the pipeline and load the laws once"""
+    from interpreter import Interpreter
+    # Modules run_file would otherwise import on its first call
+    import main, lowerer, ir, qbc, ircache
+
+    global worker, record, options
+    record = record_output
+    options = run_options or {}
+    worker = Interpreter(sink=NullSink())
+
+def run_one(filename):
+    """Run one file on the warm interpreter -> (filename, status, seconds, events)"""
+    from main import run_file
+    sink = RecordingSink() if record else NullSink()
+    start = time.perf_counter()
+    status = run_file(filename, sink=sink, interpreter=worker, **options)
+    elapsed = time.perf_counter() - start
+    return filename, status, elapsed, [event for _, event in sink.take()] if record else []
+
+class BatchRunner:
+    """Runs files across `jobs` warm workers (0/None: one per CPU).
+
+    Each file's events (unless `output` is False) are replayed into `sink`
+    in the order the files were given, followed by a file_result event; a
+    batch_summary event closes the run. With jobs=1 the files run in this
+    process. Extra `options` are passed on to run_file.
+    """
+
+    def __init__(self, jobs=None, sink=None, output=True, **options):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.sink = sink or NullSink()
+        self.output = output
+        self.options = options
+
+    def run(self, files):
+        """Run every file; returns the number that failed"""
+        start = time.perf_counter()
+        record_output = self.output and self.sink.enabled
+        if self.jobs == 1 or len(files) < 2:
+            init_worker(record_output, self.options)
+            failed = self.report(map(run_one, files))
+        else:
+            # Imported here: a single-process batch does not need the pool
+            from concurrent.futures import ProcessPoolExecutor
+            chunksize = max(1, len(files) // (self.jobs * 8))
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker,
+                                     initargs=(record_output, self.options)) as pool:
+                failed = self.report(pool.map(run_one, files, chunksize=chunksize))
+        self.sink.emit(("batch_summary", len(files), len(files) - failed, failed,
+                        time.perf_counter() - start, self.jobs))
+        self.sink.flush()
+        return failed
+
+    def report(self, results):
+        failed = 0
+        for filename, status, elapsed, events in results:
+            for event in events:
+                self.sink.emit(event)
+            self.sink.emit(("file_result", filename, status == 0, elapsed))
+            failed += status != 0
+        return failed
@@ -0,0 +1,174 @@
+"""
+QBET Bytecode Compiler
+Flattens Program/Block/FunctionDeclaration ASTs into bytecode for the VM.
+"""
+
+from ast_nodes import *
+
+# Opcodes. Every instruction is two words: opcode, argument.
+LOAD_CONST = 0      # push constants[arg]
+LOAD_GLOBAL = 1     # push globals[constants[arg]]
+STORE_GLOBAL = 2    # define globals[constants[arg]] = pop
+LOAD_FAST = 3       # push locals[arg], falling back to globals when unbound
+STORE_FAST = 4      # locals[arg] = pop
+POP = 5             # discard top of stack
+PRINT = 6           # print `arg` popped values
+CALL = 7            # call function constants[arg] = (name, argc)
+MAKE_QUBIT = 8      # push QuantumState(pop)
+ENTANGLE = 9        # link the qubit pair constants[arg]; push null
+MEASURE = 10        # observe the value on the stack, named constants[arg]
+RETURN = 11         # leave the frame with null
+IMPORT = 12         # bind stdlib module constants[arg] into globals; push null
+
+OPNAMES = {
+    LOAD_CONST: "LOAD_CONST",
+    LOAD_GLOBAL: "LOAD_GLOBAL",
+    STORE_GLOBAL: "STORE_GLOBAL",
+    LOAD_FAST: "LOAD_FAST",
+    STORE_FAST: "STORE_FAST",
+    POP: "POP",
+    PRINT: "PRINT",
+    CALL: "CALL",
+    MAKE_QUBIT: "MAKE_QUBIT",
+    ENTANGLE: "ENTANGLE",
+    MEASURE: "MEASURE",
+    RETURN: "RETURN",
+    IMPORT: "IMPORT",
+}
+
+class Code:
+    """A compiled program or function body"""
+
+    def __init__(self, name, is_function=False):
+        self.name = name
+        self.is_function = is_function
+        self.code = []
+        self.constants = []
+        self.constant_index = {}
+        self.slots = []         # Local variable names, indexed by slot
+        self.functions = {}     # Compiled FunctionDeclarations by name
+
+    def constant(self, value):
+        key = (type(value), value)
+        if key not in self.constant_index:
+            self.constant_index[key] = len(self.constants)
+            self.constants.append(value)
+        return self.constant_index[key]
+
+    def slot(self, name):
+        if name not in self.slots:
+            self.slots.append(name)
+        return self.slots.index(name)
+
+    def emit(self, op, arg=0):
+        # Peephole: a constant that is pushed only to be discarded is dropped.
+        if op == POP and self.code and self.code[-2] == LOAD_CONST:
+            del self.code[-2:]
+            return
+        self.code.append(op)
+        self.code.append(arg)
+
+    def disassemble(self):
+        lines = []
+        for pc in range(0, len(self.code), 2):
+            op, arg = self.code[pc], self.code[pc + 1]
+            lines.append(f"{pc:4} {OPNAMES[op]:<12} {arg}")
+        return "\n".join(lines)
+
+class Compiler:
+    """Compiles an AST with the same semantics as Interpreter.execute.
+
+    Node types the tree walker does not visit compile to a null constant,
+    exactly as generic_visit evaluates them to None.
+    """
+
+    def compile(self, program):
+        code = Code("<program>")
+        self.compile_node(program, code)
+        code.emit(RETURN)
+        return code
+
+    def compile_node(self, node, code):
+        method = getattr(self, f'compile_{type(node).__name__}', None)
+        if method is None:
+            code.emit(LOAD_CONST, code.constant(None))
+            return
+        method(node, code)
+
+    def compile_statements(self, statements, code):
+        for stmt in statements:
+            self.compile_node(stmt, code)
+            code.emit(POP)
+
+    def compile_Program(self, node, code):
+        self.compile_statements(node.statements, code)
+        code.emit(LOAD_CONST, code.constant(None))
+
+    def compile_Block(self, node, code):
+        self.compile_statements(node.statements, code)
+        code.emit(LOAD_CONST, code.constant(None))
+
+    def compile_ImportStatement(self, node, code):
+        code.emit(IMPORT, code.constant(node.module))
+
+    def compile_FunctionDeclaration(self, node, code):
+        function = Code(node.name, is_function=True)
+        self.compile_node(node.body, function)
+        function.emit(POP)
+        function.emit(RETURN)
+        code.functions[node.name] = function
+        code.emit(LOAD_CONST, code.constant(None))
+
+    def compile_ExpressionStatement(self, node, code):
+        self.compile_node(node.expression, code)
+
+    def compile_Assignment(self, node, code):
+        self.compile_node(node.value, code)
+        self.store(node.name, code)
+        code.emit(LOAD_CONST, code.constant(None))
+
+    def compile_FunctionCall(self, node, code):
+        for arg in node.arguments:
+            self.compile_node(arg, code)
+        if node.name == "print":
+            code.emit(PRINT, len(node.arguments))
+        else:
+            code.emit(CALL, code.constant((node.name, len(node.arguments))))
+
+    def compile_QubitCreation(self, node, code):
+        self.compile_node(node.alpha, code)
+        code.emit(MAKE_QUBIT)
+
+    def compile_Entanglement(self, node, code):
+        code.emit(ENTANGLE, code.constant((node.qubit1, node.qubit2)))
+
+    def compile_Measurement(self, node, code):
+        self.load(node.qubit, code)
+        code.emit(MEASURE, code.constant(node.qubit))
+
+    def compile_BooleanLiteral(self, node, code):
+        code.emit(LOAD_CONST, code.constant(node.value))
+
+    def compile_NullLiteral(self, node, code):
+        code.emit(LOAD_CONST, code.constant(None))
+
+    def compile_StringLiteral(self, node, code):
+        code.emit(LOAD_CONST, code.constant(node.value))
+
+    def compile_NumberLiteral(self, node, code):
+        code.emit(LOAD_CONST, code.constant(node.value))
+
+    def compile_Identifier(self, node, code):
+        self.load(node.name, code)
+
+    def load(self, name, code):
+        if code.is_function:
+            code.emit(LOAD_FAST, code.slot(name))
+        else:
+            code.emit(LOAD_GLOBAL, code.constant(name))
+
+    def store(self, name, code):
+        if code.is_function:
+            code.emit(STORE_FAST, code.slot(name))
+        else:
+            code.emit(STORE_GLOBAL, code.constant(name))
@@ -0,0 +1,106 @@
+"""
+QBET Kernel Contract
+Parses laws/c.qb into an immutable Contract, memoized per process.
+"""
+
+import os
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+from errors import QBETError
+
+QBET_ROOT = Path(__file__).parent.parent
+DEFAULT_CONTRACT = QBET_ROOT / "laws" / "c.qb"
+
+LAW = re.compile(r'LAW\s+(0[xX][0-9A-Fa-f]+|\d+)\s+(\w+)\s*:\s*(.*)', re.IGNORECASE)
+PRIMITIVE = re.compile(r'PRIMITIVE\s+(\w+)\s*\(([^)]*)\)\s*:\s*(.*)', re.IGNORECASE)
+PHYSICS = re.compile(r'PHYSICS\s*\{\s*', re.IGNORECASE)
+CONSTANT = re.compile(r'(\w+)\s*:\s*(.*)')
+
+class ContractError(QBETError):
+    pass
+
+class Law(NamedTuple):
+    code: int
+    name: str
+    text: str
+
+    def __str__(self):
+        return f"LAW 0x{self.code:02X} {self.name}: {self.text}"
+
+class Primitive(NamedTuple):
+    name: str
+    params: tuple
+    text: str
+
+class Contract(NamedTuple):
+    """Laws, primitives and PHYSICS constants of a kernel contract"""
+    path: Path
+    laws: tuple
+    primitives: tuple
+    physics: MappingProxyType
+
+    def primitive(self, name):
+        for primitive in self.primitives:
+            if primitive.name == name:
+                return primitive
+        return None
+
+def constant(value):
+    """PHYSICS value: TRUE/FALSE, int, float, or the raw text (e.g. 1ns)"""
+    if value.upper() in ("TRUE", "FALSE"):
+        return value.upper() == "TRUE"
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    return value
+
+def parse_contract(text, path=None):
+    """Parse contract source into a Contract; raises ContractError on bad lines"""
+    laws, primitives, physics = [], [], {}
+    in_physics = False
+    for lineno, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if in_physics:
+            if line == "}":
+                in_physics = False
+            elif match := CONSTANT.fullmatch(line):
+                physics[match.group(1)] = constant(match.group(2).strip())
+            else:
+                raise ContractError(f"Malformed PHYSICS constant: {line}", lineno)
+        elif match := LAW.fullmatch(line):
+            laws.append(Law(int(match.group(1), 0), match.group(2), match.group(3).strip()))
+        elif match := PRIMITIVE.fullmatch(line):
+            params = tuple(p.strip() for p in match.group(2).split(",") if p.strip())
+            primitives.append(Primitive(match.group(1), params, match.group(3).strip()))
+        elif PHYSICS.fullmatch(line):
+            in_physics = True
+        else:
+            raise ContractError(f"Unrecognised contract line: {line}", lineno)
+    if in_physics:
+        raise ContractError("Unterminated PHYSICS block")
+    return Contract(path, tuple(laws), tuple(primitives), MappingProxyType(physics))
+
+# Resolved path -> (mtime_ns, Contract)
+_contracts = {}
+
+def load_contract(path=None):
+    """The Contract at `path` (default laws/c.qb under the QBET root).
+
+    Parsed once per process and shared by every caller until the file's
+    mtime changes. Raises FileNotFoundError if the contract is missing.
+    """
+    path = Path(path or DEFAULT_CONTRACT).resolve()
+    mtime = os.stat(path).st_mtime_ns
+    cached = _contracts.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    contract = parse_contract(path.read_text(encoding="utf-8"), path)
+    _contracts[path] = (mtime, contract)
+    return contract
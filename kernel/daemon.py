@@ -0,0 +1,174 @@
+"""
+QBET Kernel Daemon
+Keeps warm interpreters behind a local Unix socket so that short scripts
+skip process startup.
+
+Protocol: the client sends one JSON line {"file": ..., "use_cache": ...};
+the daemon streams back the run's events as JSON lines, as written by
+JSONLinesSink, and finishes with {"status": <exit code>}.
+"""
+
+import os
+import sys
+import json
+import queue
+import stat
+import signal
+import socket
+import tempfile
+import socketserver
+from pathlib import Path
+
+from runtime.events import JSONLinesSink, NullSink, event_from_record
+
+# Events are streamed back in batches of this many lines
+STREAM_BATCH = 64
+
+def default_socket_path():
+    """$QBET_SOCKET, else $XDG_RUNTIME_DIR/qbet/kernel.sock, else a per-user temp dir.
+
+    Whichever is used, the socket's directory must be private (see
+    check_private).
+    """
+    if os.environ.get("QBET_SOCKET"):
+        return Path(os.environ["QBET_SOCKET"])
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "qbet" / "kernel.sock"
+    return Path(tempfile.gettempdir()) / f"qbet-{os.getuid()}" / "kernel.sock"
+
+class DaemonUnavailable(Exception):
+    pass
+
+def check_private(directory):
+    """Raise OSError unless `directory` is a real directory (not a symlink)
+    owned by this user with mode 0700.
+
+    The fallback socket directory has a predictable name in a shared temp
+    dir, so another user could create it first and then impersonate the
+    daemon or send it requests.
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        raise OSError(f"{directory} is not a directory")
+    if info.st_uid != os.getuid():
+        raise OSError(f"{directory} is owned by another user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        raise OSError(f"{directory} must have mode 0700, not {stat.S_IMODE(info.st_mode):04o}")
+
+class KernelHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        stream = self.connection.makefile('w', encoding='utf-8')
+        sink = JSONLinesSink(stream, batch=STREAM_BATCH)
+        interpreter = self.server.interpreters.get()
+        try:
+            status = self.server.run(request["file"], sink=sink, interpreter=interpreter,
+                                     use_cache=request.get("use_cache", True),
+                                     write_ir=request.get("write_ir", False),
+                                     jobs=request.get("jobs", 1))
+            stream.write(json.dumps({"status": status}) + "\n")
+            stream.flush()
+        except OSError:
+            pass  # Client went away
+        finally:
+            self.server.interpreters.put(interpreter)
+
+class KernelDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves execution requests with a fixed pool of warm interpreters.
+
+    `run` is the pipeline entry point, called as
+    run(filename, sink=..., interpreter=..., use_cache=..., write_ir=..., jobs=...).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path, run, workers=4):
+        # Imported here so that clients do not load the interpreter
+        from interpreter import Interpreter
+
+        self.path = Path(path)
+        self.run = run
+        self.interpreters = queue.Queue()
+        for _ in range(workers):
+            self.interpreters.put(Interpreter(sink=NullSink()))
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        check_private(self.path.parent)
+        if self.path.exists():
+            if self.alive():
+                raise OSError(f"A kernel daemon is already serving {self.path}")
+            self.path.unlink()  # Stale socket from a daemon that died
+        # The socket is created by bind(); keep it private from the start
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.path), KernelHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(self.path, 0o600)
+
+    def alive(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.path))
+                return True
+            except OSError:
+                return False
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+def stop(signum, frame):
+    raise KeyboardInterrupt
+
+def serve(run, path=None, workers=4):
+    """Run a daemon until interrupted or terminated"""
+    signal.signal(signal.SIGTERM, stop)
+    with KernelDaemon(path or default_socket_path(), run, workers) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+def run_remote(filename, sink, path=None, use_cache=True, write_ir=False, jobs=1):
+    """Execute `filename` on the daemon, replaying its events into `sink`.
+
+    `use_cache`, `write_ir` and `jobs` are passed on to the daemon's run.
+
+    Returns the run's exit status; raises DaemonUnavailable if no daemon
+    is listening.
+    """
+    path = Path(path or default_socket_path())
+    try:
+        # Only talk to a daemon whose socket no other user could have placed
+        check_private(path.parent)
+    except OSError as e:
+        raise DaemonUnavailable(f"Refusing kernel daemon socket {path}: {e.strerror or e}")
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(path))
+    except OSError as e:
+        conn.close()
+        raise DaemonUnavailable(f"No kernel daemon at {path} ({e.strerror})")
+
+    request = {"file": os.path.abspath(filename), "use_cache": use_cache,
+               "write_ir": write_ir, "jobs": jobs}
+    with conn, conn.makefile('rw', encoding='utf-8') as stream:
+        stream.write(json.dumps(request) + "\n")
+        stream.flush()
+        for line in stream:
+            record = json.loads(line)
+            if "status" in record:
+                return record["status"]
+            event = event_from_record(record)
+            if sink.enabled:
+                sink.emit(event)
+            elif event[0] == "error":
+                print(f"❌ {event[1]}", file=sys.stderr)
+    sink.emit(("error", "Kernel daemon closed the connection"))
+    return 1
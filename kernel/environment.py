@@ -5,6 +5,9 @@ Manages variable scopes and symbol tables.
 
 from errors import NameError as QBETNameError
 
+# Marks a frame slot whose variable has not been assigned yet
+UNBOUND = object()
+
 class Environment:
     """Manages variable scopes"""
     
@@ -41,3 +44,25 @@ class Environment:
         elif self.parent:
             return self.parent.exists(name)
         return False
+
+class Frame:
+    """Array-backed scope for variables with a resolved (depth, slot) address"""
+
+    __slots__ = ('values', 'parent')
+
+    def __init__(self, size, parent=None):
+        self.values = [UNBOUND] * size
+        self.parent = parent
+
+    def get(self, depth, slot):
+        """Get slot value, or UNBOUND if it has not been assigned"""
+        frame = self
+        for _ in range(depth):
+            frame = frame.parent
+        return frame.values[slot]
+
+    def set(self, depth, slot, value):
+        frame = self
+        for _ in range(depth):
+            frame = frame.parent
+        frame.values[slot] = value
@@ -1,11 +1,10 @@
 from ast_nodes import *
-from environment import Environment
+from environment import Environment, Frame, UNBOUND
+from resolver import Resolver
+from contract import load_contract, ContractError
+from runtime.events import TTYSink
+import stdlib
 import random
-from pathlib import Path
-
-# ANSI Colors
-DIM = "\033[2m"
-RESET = "\033[0m"
 
 class QuantumState:
     def __init__(self, value):
@@ -17,85 +16,162 @@ class QuantumState:
             return f"{self.value}"
         return f"|ψ⟩({self.value})"
 
+def measurement_event(name, value):
+    """Event for observing a variable, shared with the VM"""
+    if isinstance(value, QuantumState):
+        return ("collapse", name, value.value)
+    if isinstance(value, str) and value == "stabilized":
+        return ("stable", name)
+    return ("state", name, value)
+
+def run_circuit(env):
+    """Apply gates deferred by the quantum stdlib's lazy mode before a value
+    is observed; a no-op unless `use quantum` bound run_circuit"""
+    run = env.variables.get('run_circuit')
+    if callable(run):
+        run()
+
+def call_builtin(env, name, args):
+    """Call a stdlib function bound by `use`, shared with the VM"""
+    builtin = env.variables.get(name)
+    if not callable(builtin):
+        raise Exception(f"Undefined function: {name}")
+    return builtin(*args)
+
 class Interpreter:
-    def __init__(self):
+    # Visitor function per AST node type, filled in on first use. Each
+    # subclass gets its own table so overridden visitors are honoured.
+    dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dispatch = {}
+        cls.opcodes = dict(cls.opcodes)
+
+    def __init__(self, sink=None, contract=None):
+        # Events go to an unbuffered console renderer unless the caller
+        # supplies a sink (see runtime.events)
+        self.sink = sink or TTYSink()
+        self.reset()
+        self.load_laws(contract)
+
+    def reset(self):
+        """Forget all program state; the loaded laws are kept"""
         self.env = Environment()
         self.globals = self.env
+        self.frame = None
         self.functions = {}
-        self.laws = []
-        self.load_laws()
-
-    def load_laws(self):
-        """Enforce Sovereign Kernel Contract c.qb"""
-        law_path = Path("laws/c.qb")
-        if law_path.exists():
-            with open(law_path, 'r') as f:
-                for line in f:
-                    clean = line.strip().upper()
-                    if clean.startswith("LAW"):
-                        self.laws.append(line.strip())
-                    elif clean.startswith("PRIMITIVE"):
-                        # Primitives define the bedrock of our reality
-                        pass
+        # Stdlib bindings loaded by `use`, with their state (e.g. the circuit)
+        self.modules = {}
+
+    def load_laws(self, contract=None):
+        """Enforce Sovereign Kernel Contract c.qb (shared, parsed once per process)"""
+        if contract is None:
+            try:
+                contract = load_contract()
+            except (FileNotFoundError, ContractError):
+                # Missing or invalid, run_file reports it when it binds
+                pass
+        self.contract = contract
+        self.laws = contract.laws if contract else ()
 
     def interpret(self, program):
-        if self.laws:
-            print(f"{DIM}⚖️  Enforcing {len(self.laws)} Sovereign Laws...{RESET}")
+        if self.laws and self.sink.enabled:
+            self.sink.emit(("laws", len(self.laws)))
         return None
 
     def execute_instruction(self, instr):
-        op = instr["t"]
-        v = instr["v"]
-
-        if op == "UNIVERSE":
-            name, props = v
-            print(f"🌌 Manifesting Universe: {name}")
-            for pk, pv in props.items():
-                print(f"  {DIM}property {pk}: {pv}{RESET}")
-            self.env.define(name, {"type": "universe", "props": props})
-
-        elif op == "ENTITY":
-            name, props = v
-            print(f"👤 Defining Entity: {name}")
-            for pk, pv in props.items():
-                print(f"  {DIM}role: {pv}{RESET}") if pk == "role" else print(f"  {DIM}{pk}: {pv}{RESET}")
-            self.env.define(name, {"type": "entity", "props": props})
-
-        elif op == "MANIFEST":
-            u_name, e_name = v
-            print(f"✨ Manifesting {u_name} with {e_name}...")
-            # Here we would bind entity to universe state
-
-        elif op == "FLOW_TIME":
-            direction = v
-            print(f"⏳ Flowing time {direction}...")
-
-        elif op == "OBSERVE":
-            target = v
-            value = self.env.get(target)
-            print(f"👁️  Observing {target}... Status: STABLE")
-            if isinstance(value, dict) and "props" in value:
-                print(f"  {DIM}Reality coherence: 0.9999{RESET}")
+        handler = self.opcodes.get(instr["t"])
+        if handler is None:
+            return self.unknown_opcode(instr["t"], instr["v"])
+        return handler(self, instr["v"])
 
-        else:
-            print(f"Warning: Unknown operational primitive {op}")
+    @classmethod
+    def register_opcode(cls, op, handler):
+        """Route IR opcode `op` to `handler(interpreter, value)`"""
+        cls.opcodes[op] = handler
+
+    def op_universe(self, v):
+        name, props = v
+        if self.sink.enabled:
+            self.sink.emit(("universe", name, props))
+        self.env.define(name, {"type": "universe", "props": props})
+
+    def op_entity(self, v):
+        name, props = v
+        if self.sink.enabled:
+            self.sink.emit(("entity", name, props))
+        self.env.define(name, {"type": "entity", "props": props})
+
+    def op_manifest(self, v):
+        u_name, e_name = v
+        if self.sink.enabled:
+            self.sink.emit(("manifest", u_name, e_name))
+        # Here we would bind entity to universe state
+
+    def op_flow_time(self, v):
+        direction = v
+        if self.sink.enabled:
+            self.sink.emit(("flow_time", direction))
+
+    def op_observe(self, v):
+        target = v
+        run_circuit(self.globals)
+        value = self.env.get(target)
+        if self.sink.enabled:
+            self.sink.emit(("observe", target, isinstance(value, dict) and "props" in value))
+
+    def unknown_opcode(self, op, v):
+        if self.sink.enabled:
+            self.sink.emit(("unknown_opcode", op))
+
+    # Handler per IR opcode; new primitives join via register_opcode.
+    opcodes = {
+        "UNIVERSE": op_universe,
+        "ENTITY": op_entity,
+        "MANIFEST": op_manifest,
+        "FLOW_TIME": op_flow_time,
+        "OBSERVE": op_observe,
+    }
 
     def execute(self, node):
-        method_name = f'visit_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        visitor = self.dispatch.get(type(node))
+        if visitor is None:
+            visitor = self.resolve_visitor(type(node))
+        return visitor(self, node)
+
+    @classmethod
+    def resolve_visitor(cls, node_type):
+        """Look up visit_<NodeType> once and cache it in the dispatch table"""
+        visitor = getattr(cls, f'visit_{node_type.__name__}', cls.generic_visit)
+        cls.dispatch[node_type] = visitor
+        return visitor
+
+    @classmethod
+    def register_visitor(cls, node_type, visitor):
+        """Route `node_type` to `visitor(interpreter, node)`"""
+        cls.dispatch[node_type] = visitor
 
     def generic_visit(self, node):
         # print(f"Warning: No visit_{type(node).__name__} method")
         return None
 
     def visit_Program(self, node):
+        if not node.resolved:
+            Resolver().resolve(node)
+        # First pass: declarations are callable from anywhere in the program
+        for stmt in node.statements:
+            if isinstance(stmt, FunctionDeclaration):
+                self.functions[stmt.name] = stmt
         for stmt in node.statements:
             self.execute(stmt)
 
     def visit_ImportStatement(self, node):
-        # Placeholder for module imports
-        pass
+        # Standard library modules are loaded on first use; other names
+        # (e.g. `use math`) are accepted and ignored
+        bindings = stdlib.load_module(node.module, self.modules)
+        if bindings:
+            self.globals.variables.update(bindings)
 
     def visit_FunctionDeclaration(self, node):
         # Functions are registered in the first pass
@@ -110,50 +186,60 @@ class Interpreter:
 
     def visit_Assignment(self, node):
         value = self.execute(node.value)
-        self.env.define(node.name, value)
+        if node.slot is not None and self.frame is not None:
+            self.frame.set(node.depth, node.slot, value)
+        else:
+            self.env.define(node.name, value)
         return value
 
+    def lookup(self, node, name):
+        """Read a variable by lexical address, falling back to the Environment"""
+        if node.slot is not None and self.frame is not None:
+            value = self.frame.get(node.depth, node.slot)
+            if value is not UNBOUND:
+                return value
+        return self.env.get(name)
+
     def visit_FunctionCall(self, node):
         if node.name == "print":
             args = [str(self.execute(arg)) for arg in node.arguments]
-            print(" ".join(args))
+            if self.sink.enabled:
+                self.sink.emit(("print", " ".join(args)))
             return None
         
         return self.execute_function(node.name, [self.execute(arg) for arg in node.arguments])
 
     def execute_function(self, name, args):
         if name not in self.functions:
-            raise Exception(f"Undefined function: {name}")
+            return call_builtin(self.globals, name, args)
         
         func = self.functions[name]
         # Create new environment for function scope
-        old_env = self.env
+        old_env, old_frame = self.env, self.frame
         self.env = Environment(self.globals)
+        self.frame = Frame(func.frame_size) if func.frame_size is not None else None
         
         # Bind parameters (names only for now as per parser)
         # for param, arg in zip(func.parameters, args):
         #     self.env.define(param, arg)
             
         result = self.execute(func.body)
-        self.env = old_env
+        self.env, self.frame = old_env, old_frame
         return result
 
     def visit_QubitCreation(self, node):
         return QuantumState(self.execute(node.alpha))
 
     def visit_Entanglement(self, node):
-        print(f"🔗 Linking {node.qubit1} and {node.qubit2} in quantum entanglement...")
+        if self.sink.enabled:
+            self.sink.emit(("link", node.qubit1, node.qubit2))
         return None
 
     def visit_Measurement(self, node):
-        value = self.env.get(node.qubit)
-        if isinstance(value, QuantumState):
-            print(f"🌀 Observing {node.qubit}... Probability wave collapsed.")
-            print(f"✨ Result: {value.value}")
-        elif isinstance(value, str) and value == "stabilized":
-            print(f"✨ Observing {node.qubit}... Result: STABLE")
-        else:
-            print(f"👁️  Observing {node.qubit}... State: {value}")
+        run_circuit(self.globals)
+        value = self.lookup(node, node.qubit)
+        if self.sink.enabled:
+            self.sink.emit(measurement_event(node.qubit, value))
         return value
 
     def visit_BooleanLiteral(self, node):
@@ -169,4 +255,4 @@ class Interpreter:
         return node.value
 
     def visit_Identifier(self, node):
-        return self.env.get(node.name)
+        return self.lookup(node, node.name)
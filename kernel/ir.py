@@ -0,0 +1,130 @@
+"""
+QBET Canonical IR (.qb)
+Serialization of lowered instruction streams.
+"""
+
+import json
+
+# Characters that may follow a complete JSON number
+DELIMITERS = (",", "]", "}", " ", "\t", "\r", "\n")
+
+def write_qb(file, instructions, version, source):
+    """Write instructions to an open file in the canonical .qb layout.
+
+    Instructions are encoded one at a time, so `instructions` may be a
+    generator. The output is byte-identical to json.dump(..., indent=2)
+    of the full {"version", "source", "instructions"} document.
+    """
+    file.write("{\n")
+    file.write(f'  "version": {json.dumps(version)},\n')
+    file.write(f'  "source": {json.dumps(source)},\n')
+    file.write('  "instructions": [')
+    count = 0
+    for instr in instructions:
+        file.write(",\n    " if count else "\n    ")
+        file.write(json.dumps(instr, indent=2).replace("\n", "\n    "))
+        count += 1
+    file.write("\n  ]\n}" if count else "]\n}")
+    return count
+
+class QBReader:
+    """Incremental reader for canonical .qb files.
+
+    Iterating yields instructions one at a time while the file is read in
+    chunks, so the first instruction is available before the rest of the
+    file has been read. Other top-level members ("version", "source") are
+    collected into `header` as they are encountered.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        self.file = open(path, "r", encoding="utf-8")
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.header = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    @property
+    def version(self):
+        return self.header.get("version")
+
+    @property
+    def source(self):
+        return self.header.get("source")
+
+    def __iter__(self):
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            if key == "instructions":
+                self.expect("[")
+                if self.peek() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self.value()
+                        if self.expect(",", "]") == "]":
+                            break
+            else:
+                self.header[key] = self.value()
+            if self.expect(",", "}") == "}":
+                return
+
+    def fill(self):
+        # Read at least as much as is already buffered, so re-decoding a
+        # value that spans many chunks stays linear.
+        chunk = self.file.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self, *chars):
+        char = self.peek()
+        if char == "" or char not in chars:
+            raise ValueError(f"Malformed .qb: expected {' or '.join(chars)}, got {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            # A number cut by the chunk boundary decodes as a shorter one
+            # ("12345." as 12345), so it is only complete once a delimiter
+            # follows it.
+            if (not self.eof and isinstance(value, (int, float))
+                    and self.buffer[end:end + 1] not in DELIMITERS):
+                self.fill()
+                continue
+            self.pos = end
+            return value
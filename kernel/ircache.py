@@ -0,0 +1,120 @@
+"""
+QBET IR Cache
+Content-addressed store of lowered instructions, keyed by source hash and
+kernel version, so unchanged universes skip the Lexer/Lowerer entirely.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+from ir import write_qb
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def default_cache_dir():
+    """$QBET_CACHE_DIR, else $XDG_CACHE_HOME/qbet/ir, else ~/.cache/qbet/ir"""
+    if os.environ.get("QBET_CACHE_DIR"):
+        return Path(os.environ["QBET_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "qbet" / "ir"
+
+class IRCache:
+    """Size-bounded cache of lowered IR.
+
+    Entries are canonical .qb files named by the SHA-256 of the kernel
+    version plus the source bytes, so editing a source or upgrading the
+    kernel invalidates its entry. When the cache grows past `max_bytes`
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, version, root=None, max_bytes=None):
+        self.version = version
+        self.root = Path(root) if root else default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("QBET_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+
+    def key(self, source_path):
+        digest = hashlib.sha256(self.version.encode("utf-8") + b"\0")
+        with open(source_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def entry(self, key):
+        return self.root / f"{key}.qb"
+
+    def load(self, key):
+        """Return cached instructions for `key`, or None on a miss"""
+        path = self.entry(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                ir_data = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.discard(path)
+            return None
+        if ir_data.get("version") != self.version:
+            self.discard(path)
+            return None
+        return ir_data["instructions"]
+
+    def store(self, key, instructions, source):
+        """Record instructions for `key`; the cache is best-effort"""
+        partial = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # Unique per writer: daemon threads may store the same key at once
+            fd, partial = tempfile.mkstemp(dir=self.root, suffix=".partial")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                write_qb(f, instructions, self.version, str(source))
+            os.replace(partial, self.entry(key))
+            self.evict()
+        except OSError:
+            if partial:
+                self.discard(partial)
+
+    def entries(self):
+        try:
+            return [p for p in self.root.iterdir() if p.suffix == ".qb"]
+        except FileNotFoundError:
+            return []
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        sized = []
+        for path in self.entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            sized.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in sized)
+        for _, size, path in sorted(sized):
+            if total <= self.max_bytes:
+                break
+            self.discard(path)
+            total -= size
+
+    def clear(self):
+        """Delete every entry, and any partial file a killed writer left behind"""
+        removed = 0
+        try:
+            leftovers = list(self.root.glob("*.partial"))
+        except OSError:
+            leftovers = []
+        for path in self.entries() + leftovers:
+            self.discard(path)
+            removed += 1
+        return removed
+
+    def discard(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -1,4 +1,6 @@
 import enum
+import re
+import sys
 
 class TokenType(enum.Enum):
     MANIFEST = "MANIFEST"
@@ -30,6 +32,8 @@ class TokenType(enum.Enum):
     EOF = "EOF"
 
 class Token:
+    __slots__ = ('type', 'value', 'line')
+
     def __init__(self, type, value, line):
         self.type = type
         self.value = value
@@ -60,10 +64,164 @@ class Lexer:
         "flow": TokenType.IDENTIFIER,
     }
 
+    # One compiled master pattern. Inline blanks are folded into the
+    # following token so that each match yields at most one token; the
+    # group that matched (m.lastindex) selects the entry in the tables below.
+    PATTERN = re.compile(r'''
+        [^\S\n]*
+        (?:
+            (?P<NEWLINE>\n)
+          | (?P<NAME>[A-Za-z_]\w*)
+          | (?P<OP>==|[={}():,;])
+          | (?P<STRING>"[^"]*"?)
+          | (?P<NUMBER>[0-9][0-9.]*)
+          | (?P<COMMENT>\#[^\n]*)
+          | (?P<OTHER>.)
+        )
+    ''', re.VERBOSE)
+
+    NEWLINE = PATTERN.groupindex["NEWLINE"]
+    NAME = PATTERN.groupindex["NAME"]
+    OP = PATTERN.groupindex["OP"]
+    STRING = PATTERN.groupindex["STRING"]
+    NUMBER = PATTERN.groupindex["NUMBER"]
+    OTHER = PATTERN.groupindex["OTHER"]
+
+    WORD = re.compile(r'\w*')
+
+    OPERATORS = {
+        "==": TokenType.EQ,
+        "=": TokenType.ASSIGN,
+        "{": TokenType.LBRACE,
+        "}": TokenType.RBRACE,
+        "(": TokenType.LPAREN,
+        ")": TokenType.RPAREN,
+        ":": TokenType.COLON,
+        ",": TokenType.COMMA,
+        ";": TokenType.SEMICOLON,
+    }
+
+    CHUNK_SIZE = 1 << 16
+
     def __init__(self, source):
         self.source = source
         self.pos = 0
         self.line = 1
+        # Symbol table for the fixed keyword and operator spellings.
+        # Identifiers go through sys.intern instead, whose entries are freed
+        # with their last token, so a streamed file's distinct names do not
+        # accumulate here.
+        self.symbols = {text: text for text in (*self.KEYWORDS, *self.OPERATORS)}
+
+    def tokenize(self):
+        tokens = list(self.scan())
+        tokens.append(Token(TokenType.EOF, '', self.line))
+        return tokens
+
+    @classmethod
+    def stream(cls, file, chunk_size=CHUNK_SIZE):
+        """Lazily tokenize an open text file, reading it in fixed-size chunks.
+
+        Only the unconsumed tail of the previous chunk is carried over, so
+        memory is bounded by the chunk size plus the longest single token.
+        """
+        lexer = cls('')
+        while True:
+            chunk = file.read(chunk_size)
+            lexer.source = lexer.source[lexer.pos:] + chunk
+            lexer.pos = 0
+            yield from lexer.scan(final=not chunk)
+            if not chunk:
+                break
+        yield Token(TokenType.EOF, '', lexer.line)
+
+    def scan(self, final=True):
+        """Yield tokens from self.source, starting at self.pos.
+
+        Unless `final`, a token that runs into the end of the buffer is left
+        unconsumed, since the next chunk may extend it.
+        """
+        source = self.source
+        end = len(source)
+        keyword = self.KEYWORDS.get
+        operators = self.OPERATORS
+        symbols = self.symbols
+        intern = sys.intern
+        identifier = TokenType.IDENTIFIER
+        NEWLINE, NAME, OP, STRING, NUMBER, OTHER = (
+            self.NEWLINE, self.NAME, self.OP, self.STRING, self.NUMBER, self.OTHER)
+        pos = self.pos
+        line = self.line
+
+        while pos < end:
+            # The scan restarts only after a token that needed the slow path.
+            for m in self.PATTERN.finditer(source, pos):
+                stop = m.end()
+                if stop == end and not final:
+                    self.pos, self.line = pos, line
+                    return
+                kind = m.lastindex
+                if kind == NAME:
+                    text = m.group(NAME)
+                    text = intern(text)
+                    yield Token(keyword(text, identifier), text, line)
+                elif kind == NEWLINE:
+                    line += 1
+                elif kind == OP:
+                    text = symbols[m.group(OP)]
+                    yield Token(operators[text], text, line)
+                elif kind == STRING:
+                    # Newlines inside strings do not advance the line counter.
+                    text = m.group(STRING)
+                    value = text[1:-1] if len(text) > 1 and text[-1] == '"' else text[1:]
+                    yield Token(TokenType.STRING, value, line)
+                elif kind == NUMBER:
+                    if stop < end and source[stop] > '\x7f':
+                        # Non-ASCII digits (e.g. superscripts) continue a number.
+                        self.pos, self.line = stop, line
+                        token = self.scan_number(m.start(NUMBER))
+                        break
+                    yield Token(TokenType.NUMBER, m.group(NUMBER), line)
+                elif kind == OTHER:
+                    char = m.group(OTHER)
+                    if char.isalpha() or char.isdigit():
+                        self.pos, self.line = stop, line
+                        token = self.scan_other(char)
+                        break
+                pos = stop
+            else:
+                pos = end
+                continue
+
+            if self.pos == end and not final:
+                self.pos = pos
+                return
+            yield token
+            pos = self.pos
+
+        self.pos, self.line = pos, line
+
+    def scan_number(self, start):
+        source = self.source
+        while self.pos < len(source) and (source[self.pos].isdigit() or source[self.pos] == '.'):
+            self.pos += 1
+        return Token(TokenType.NUMBER, source[start:self.pos], self.line)
+
+    def scan_other(self, char):
+        """Non-ASCII identifier and number starts"""
+        start = self.pos - 1
+        if char.isalpha():
+            self.pos = self.WORD.match(self.source, self.pos).end()
+            value = self.source[start:self.pos]
+            value = sys.intern(value)
+            return Token(self.KEYWORDS.get(value, TokenType.IDENTIFIER), value, self.line)
+        return self.scan_number(start)
+
+class ScanLexer(Lexer):
+    """Reference character-at-a-time scanner.
+
+    Kept alongside the regex engine for equivalence checks and benchmarks.
+    """
 
     def tokenize(self):
         tokens = []
@@ -1,40 +1,54 @@
+from collections import deque
 from lexer import Lexer, TokenType
 
 class Lowerer:
-    def __init__(self, source):
-        self.lexer = Lexer(source)
-        self.tokens = self.lexer.tokenize()
-        self.pos = 0
+    def __init__(self, source=None, tokens=None):
+        if tokens is None:
+            tokens = Lexer(source).tokenize()
+        # Tokens are pulled on demand; only the lookahead window is held.
+        self.tokens = iter(tokens)
+        self.window = deque()
 
-    def peek(self):
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return None
+    @classmethod
+    def from_file(cls, file):
+        """Lower an open .qbet file without reading it into memory"""
+        return cls(tokens=Lexer.stream(file))
+
+    def peek(self, offset=0):
+        while len(self.window) <= offset:
+            token = next(self.tokens, None)
+            if token is None:
+                return None
+            self.window.append(token)
+        return self.window[offset]
 
     def consume(self, expected_type=None):
         token = self.peek()
         if expected_type and token and token.type != expected_type:
             raise Exception(f"Expected {expected_type}, got {token.type}")
-        self.pos += 1
+        if token is not None:
+            self.window.popleft()
         return token
 
     def lower(self):
-        instructions = []
+        return list(self.iter_lower())
+
+    def iter_lower(self):
+        """Yield IR instructions as soon as each declaration is lowered"""
         while self.peek():
             token = self.peek()
             if token.value == "universe":
-                instructions.extend(self.lower_universe())
+                yield from self.lower_universe()
             elif token.value == "entity":
-                instructions.extend(self.lower_entity())
+                yield from self.lower_entity()
             elif token.value == "manifest":
-                instructions.extend(self.lower_manifest())
+                yield from self.lower_manifest()
             elif token.value == "flow":
-                instructions.extend(self.lower_flow())
+                yield from self.lower_flow()
             elif token.value == "observe":
-                instructions.extend(self.lower_observe())
+                yield from self.lower_observe()
             else:
                 self.consume() # Skip unknown
-        return instructions
 
     def lower_universe(self):
         self.consume() # universe
@@ -54,7 +68,7 @@ class Lowerer:
             # If next is ident but we haven't hit a new property yet, it's part of the list
             while self.peek() and self.peek().type == TokenType.IDENTIFIER:
                  # Is this a new property? (followed by colon)
-                 if self.pos + 1 < len(self.tokens) and self.tokens[self.pos+1].type == TokenType.COLON:
+                 if self.peek(1) and self.peek(1).type == TokenType.COLON:
                       break
                  vals.append(self.consume().value)
                  if self.peek() and self.peek().type == TokenType.COMMA:
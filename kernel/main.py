@@ -4,6 +4,7 @@ QBET - Quantum-Spiritual Programming Language
 Main entry point for the QBET interpreter.
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -11,18 +12,16 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import json
-from lexer import Lexer, Token, TokenType
-from parser import Parser
-from interpreter import Interpreter
-from lowerer import Lowerer
-from repl import REPL
-from errors import QBETError
+# Kernel modules are imported by the subcommands that need them, so that
+# `qb version`, `qb doctor` etc. start without loading the pipeline.
 
 VERSION = "1.0.0-omega"
 IDENTITY = "opendev-labs"
 QBET_ROOT = Path(__file__).parent.parent
 
+# Names of runtime.events.SINKS, for --events
+EVENT_FORMATS = ('tty', 'jsonl', 'null')
+
 # ANSI Colors for Quantum Matrix Aesthetic
 GREEN = "\033[38;5;46m"
 CYAN = "\033[38;5;51m"
@@ -35,38 +34,42 @@ def styled_print(msg, color=GREEN, bold=False):
     prefix = BOLD if bold else ""
     print(f"{prefix}{color}{msg}{RESET}")
 
-def build_qb(filename, output=None):
-    """Lower .qbet to .qb (Formalized IR)"""
+def build_qb(filename, output=None, format='qb'):
+    """Lower .qbet to .qb (Formalized IR) or its compact .qbc encoding"""
+    from lowerer import Lowerer
+    from ir import write_qb
+    from qbc import write_qbc
+
     styled_print(f"🏗️  Lowering {filename}...", CYAN)
     source_path = Path(filename)
     if not output:
-        output = source_path.with_suffix('.qb')
+        output = source_path.with_suffix(f'.{format}')
+    partial = None
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 1. Sovereign Lowering
-        lowerer = Lowerer(content)
-        instructions = lowerer.lower()
-        
-        # 2. Serialize to Canonical .qb (Mechanical IR)
-        ir_data = {
-            "version": VERSION,
-            "source": filename,
-            "instructions": instructions
-        }
-        
         # Ensure it goes to lowered/ if no output specified
         if not output and "universes/" in str(source_path):
              output = Path("lowered") / source_path.name.replace(".qbet", ".qb")
 
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(ir_data, f, indent=2)
+        # 1. Sovereign Lowering, streamed from the source file
+        # 2. Serialize to Canonical .qb (Mechanical IR) as instructions arrive
+        partial = Path(f"{output}.partial")
+        with open(filename, 'r', encoding='utf-8') as src:
+            lowerer = Lowerer.from_file(src)
+            if format == 'qbc':
+                with open(partial, 'wb') as f:
+                    write_qbc(f, lowerer.iter_lower(), VERSION, filename)
+            else:
+                with open(partial, 'w', encoding='utf-8') as f:
+                    write_qb(f, lowerer.iter_lower(), VERSION, filename)
+        os.replace(partial, output)
         
-        styled_print(f"✅ Created Canonical IR: {output}", GREEN)
+        kind = "Compact" if format == 'qbc' else "Canonical"
+        styled_print(f"✅ Created {kind} IR: {output}", GREEN)
         return 0
     except Exception as e:
+        if partial and partial.exists():
+            partial.unlink()
         styled_print(f"❌ Build failed: {e}", "\033[31m")
         return 1
 
@@ -133,67 +136,189 @@ def run_evolution(schema):
     print("✅ Evolution successful.")
     return 0
 
-def run_file(filename):
-    """Execute a QBET source file via the sovereign pipeline"""
+def run_file(filename, write_ir=False, use_cache=True, sink=None, jobs=1, interpreter=None):
+    """Execute a QBET source file via the sovereign pipeline.
+
+    Progress, program output and errors are all reported as events on
+    `sink` (a batching console renderer by default). With jobs other than
+    1, independent universes run on that many processes (0: one per CPU).
+    A warm `interpreter` is reset and reused instead of building a new one.
+
+    Without the IR cache a .qbet source is lexed, lowered and executed as
+    one stream, so memory stays bounded by the largest declaration rather
+    than the file. A cache miss lowers the whole file into a list first,
+    since that list is what gets stored.
+    """
+    from interpreter import Interpreter
+    from lowerer import Lowerer
+    from ir import QBReader
+    from qbc import QBCReader
+    from ircache import IRCache
+    from errors import QBETError
+    from contract import load_contract, ContractError
+    from runtime.events import make_sink
+
+    sink = sink or make_sink("tty")
+
+    def fail(message):
+        # Errors are reported even when regular output is discarded
+        if sink.enabled:
+            sink.emit(("error", message))
+        else:
+            print(f"❌ {message}", file=sys.stderr)
+        return 1
+
+    reader = None
     try:
         source_path = Path(filename)
+        instructions = None
         
-        # 1. Lowering: universes/.qbet -> lowered/.qb
+        # 1. Lowering: .qbet is lowered in memory; with write_ir the
+        #    canonical universes/.qbet -> lowered/.qb artifact is written too
         if source_path.suffix == '.qbet':
-            qb_file = QBET_ROOT / "lowered" / source_path.name.replace(".qbet", ".qb")
-            styled_print(f"🔄 Lowering {filename} -> {qb_file}", DIM)
-            build_qb(str(source_path), str(qb_file))
-        elif source_path.suffix == '.qb':
+            if write_ir:
+                qb_file = QBET_ROOT / "lowered" / source_path.name.replace(".qbet", ".qb")
+                sink.emit(("lower", filename, str(qb_file)))
+                sink.flush()
+                if build_qb(str(source_path), str(qb_file)) != 0:
+                    return 1
+            elif not use_cache:
+                qb_file = source_path
+                sink.emit(("lower", filename, None))
+                reader = open(source_path, 'r', encoding='utf-8')
+                instructions = lowered(Lowerer.from_file(reader))
+            else:
+                qb_file = source_path
+                cache = IRCache(VERSION)
+                key = cache.key(source_path)
+                instructions = cache.load(key)
+                if instructions is not None:
+                    sink.emit(("cached", filename))
+                else:
+                    sink.emit(("lower", filename, None))
+                    with open(source_path, 'r', encoding='utf-8') as f:
+                        try:
+                            instructions = Lowerer.from_file(f).lower()
+                        except Exception as e:
+                            return fail(f"Build failed: {e}")
+                    cache.store(key, instructions, filename)
+        elif source_path.suffix in ('.qb', '.qbc'):
             qb_file = source_path
         else:
-            styled_print(f"❌ Error: Unsupported file extension {source_path.suffix}", "\033[31m")
-            return 1
+            return fail(f"Error: Unsupported file extension {source_path.suffix}")
 
         # 2. Binding: check correlation with c.qb/laws
         law_path = QBET_ROOT / "laws/c.qb"
-        styled_print(f"🔗 Binding {qb_file} to laws/c.qb...", DIM)
-        if not law_path.exists():
-            styled_print(f"❌ Error: Kernel Contract ({law_path}) missing. Binding failed.", "\033[31m")
-            return 1
+        sink.emit(("bind", str(qb_file), "laws/c.qb"))
+        try:
+            contract = load_contract(law_path)
+        except FileNotFoundError:
+            return fail(f"Error: Kernel Contract ({law_path}) missing. Binding failed.")
+        except ContractError as e:
+            return fail(f"Error: Kernel Contract ({law_path}) is invalid: {e}. Binding failed.")
         
-        styled_print(f"🚀 Manifesting {qb_file}...", CYAN)
+        sink.emit(("execute", str(qb_file)))
         
-        instructions = []
-        if qb_file.suffix == '.qb':
-            # Fast-path: Load Canonical Instructions
-            with open(qb_file, 'r', encoding='utf-8') as f:
-                ir_data = json.load(f)
-            instructions = ir_data["instructions"]
-        else:
-            # Slow-path: Re-lower
-            with open(qb_file, 'r', encoding='utf-8') as f:
-                source = f.read()
-            lowerer = Lowerer(source)
-            instructions = lowerer.lower()
+        if instructions is None:
+            # Canonical (.qb) or compact (.qbc) IR, decoded as it executes
+            reader = QBCReader(qb_file) if qb_file.suffix == '.qbc' else QBReader(qb_file)
+            instructions = reader
         
         # Identification & Integration
-        interpreter = Interpreter()
-        for instr in instructions:
-             interpreter.execute_instruction(instr)
+        if jobs == 1:
+            if interpreter:
+                interpreter.reset()
+                interpreter.sink = sink
+                interpreter.load_laws(contract)
+            else:
+                interpreter = Interpreter(sink=sink, contract=contract)
+            for instr in instructions:
+                 interpreter.execute_instruction(instr)
+        else:
+            from scheduler import Scheduler
+            Scheduler(jobs, sink).run(instructions)
         
         return 0
     
     except FileNotFoundError:
-        print(f"❌ Error: File '{filename}' not found")
-        return 1
+        return fail(f"Error: File '{filename}' not found")
     
     except QBETError as e:
-        print(f"❌ {e}")
-        return 1
+        return fail(str(e))
     
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        fail(f"Unexpected error: {e}")
+        sink.flush()
         import traceback
         traceback.print_exc()
         return 1
 
+    finally:
+        if reader:
+            reader.close()
+        sink.flush()
+
+def lowered(lowerer):
+    """Instructions from lowerer.iter_lower(), failing like an eager build"""
+    from errors import QBETError
+    try:
+        yield from lowerer.iter_lower()
+    except Exception as e:
+        raise QBETError(f"Build failed: {e}")
+
+def run_batch(files, events="tty", quiet=False, jobs=None, **options):
+    """Execute many files on warm workers and report aggregate results"""
+    from batch import BatchRunner
+    from runtime.events import make_sink
+
+    if not files:
+        styled_print("❌ Error: No QBET files matched", "\033[31m")
+        return 1
+    runner = BatchRunner(jobs, make_sink(events), output=not quiet, **options)
+    return 1 if runner.run(files) else 0
+
+def run_daemon_client(files, events="tty", quiet=False, use_cache=True, write_ir=False, jobs=1):
+    """Execute files on a running `qb serve-kernel` daemon"""
+    from daemon import run_remote, DaemonUnavailable
+    from runtime.events import make_sink
+
+    sink = make_sink("null" if quiet else events)
+    status = 0
+    try:
+        for filename in files:
+            status |= run_remote(filename, sink, use_cache=use_cache, write_ir=write_ir, jobs=jobs)
+    except DaemonUnavailable as e:
+        styled_print(f"❌ Error: {e}. Start one with `qb serve-kernel`.", "\033[31m")
+        return 1
+    finally:
+        sink.flush()
+    return status
+
+def run_kernel_daemon(socket_path=None, workers=4):
+    """Serve warm interpreters over a Unix socket"""
+    from daemon import serve, default_socket_path
+    path = socket_path or default_socket_path()
+    styled_print(f"🛰️  Kernel daemon listening on {path} ({workers} warm interpreters)", CYAN)
+    try:
+        serve(run_file, path, workers)
+    except OSError as e:
+        styled_print(f"❌ Error: {e}", "\033[31m")
+        return 1
+    return 0
+
+def run_clean():
+    """Prune cached IR"""
+    from ircache import IRCache
+
+    cache = IRCache(VERSION)
+    removed = cache.clear()
+    styled_print(f"🧹 Pruned {removed} cached IR entries from {cache.root}", GREEN)
+    return 0
+
 def run_repl():
     """Start interactive REPL"""
+    from repl import REPL
+
     repl = REPL()
     repl.run()
     return 0
@@ -318,8 +443,18 @@ def main():
 
     # Manifest command
     manifest_parser = subparsers.add_parser('manifest', help='Translate intention into reality')
-    manifest_parser.add_argument('file', help='QBET source file (.qbet)')
+    manifest_parser.add_argument('files', nargs='+', metavar='file',
+                                 help='QBET source files (.qbet/.qb/.qbc), directories or globs')
     manifest_parser.add_argument('--no-banner', action='store_true', help='Suppress banner')
+    manifest_parser.add_argument('--write-ir', action='store_true', help='Also write the lowered .qb artifact')
+    manifest_parser.add_argument('--no-cache', action='store_true', help='Always re-lower, bypassing the IR cache')
+    manifest_parser.add_argument('--quiet', action='store_true', help='Execute without formatting program output (batch reports are still shown)')
+    manifest_parser.add_argument('--events', choices=EVENT_FORMATS, default='tty',
+                        help='Output format: console (tty), JSON lines (jsonl) or none (null)')
+    manifest_parser.add_argument('--daemon', action='store_true', help='Execute on a running `qb serve-kernel` daemon')
+    manifest_parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes, 0 for one per CPU (default: one per CPU '
+                             'for many files, 1 for a single file)')
     
     # Create command
     create_parser = subparsers.add_parser('create', help='Instantiate a new .qbet source')
@@ -327,16 +462,36 @@ def main():
 
     # Run command (alias)
     run_parser = subparsers.add_parser('run', help='Execute a QBET script')
-    run_parser.add_argument('file', help='QBET source file (.qbet)')
+    run_parser.add_argument('files', nargs='+', metavar='file',
+                            help='QBET source files (.qbet/.qb/.qbc), directories or globs')
     run_parser.add_argument('--no-banner', action='store_true', help='Suppress banner')
+    run_parser.add_argument('--write-ir', action='store_true', help='Also write the lowered .qb artifact')
+    run_parser.add_argument('--no-cache', action='store_true', help='Always re-lower, bypassing the IR cache')
+    run_parser.add_argument('--quiet', action='store_true', help='Execute without formatting program output (batch reports are still shown)')
+    run_parser.add_argument('--events', choices=EVENT_FORMATS, default='tty',
+                        help='Output format: console (tty), JSON lines (jsonl) or none (null)')
+    run_parser.add_argument('--daemon', action='store_true', help='Execute on a running `qb serve-kernel` daemon')
+    run_parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes, 0 for one per CPU (default: one per CPU '
+                             'for many files, 1 for a single file)')
     
     # Build command
     build_parser = subparsers.add_parser('build', help='Lower .qbet into canonical .qb')
     build_parser.add_argument('file', help='QBET source file (.qbet)')
-    build_parser.add_argument('--out', help='Output file (.qb)', default=None)
+    build_parser.add_argument('--out', help='Output file (.qb or .qbc, per --format)', default=None)
+    build_parser.add_argument('--format', choices=['qb', 'qbc'], default='qb',
+                              help='IR encoding: canonical JSON (.qb) or compact binary (.qbc)')
     
+    # Serve-kernel command
+    serve_parser = subparsers.add_parser('serve-kernel', help='Keep warm interpreters behind a Unix socket')
+    serve_parser.add_argument('--socket', default=None, help='Socket path (default: $QBET_SOCKET or a per-user runtime dir)')
+    serve_parser.add_argument('--workers', type=int, default=4, help='Warm interpreters (concurrent requests)')
+
     # Doctor command
     subparsers.add_parser('doctor', help='Validate semantic & runtime integrity')
+
+    # Clean command
+    subparsers.add_parser('clean', help='Prune the lowered IR cache')
     
     # Observe command
     observe_parser = subparsers.add_parser('observe', help='Inspect runtime state')
@@ -354,12 +509,23 @@ def main():
         action='store_true',
         help='Show version information'
     )
+    parser.add_argument(
+        '--startup-profile',
+        action='store_true',
+        help='Report per-module import time of the command that follows, e.g. qb --startup-profile version'
+    )
     
     # If no arguments, show help
     if len(sys.argv) == 1:
         show_help()
         return 0
 
+    # Everything after the flag is the command to profile, so it is
+    # handled before argparse sees it
+    if sys.argv[1] == '--startup-profile':
+        from startup import profile
+        return profile(sys.argv[2:])
+
     args = parser.parse_args()
     
     if args.version:
@@ -372,9 +538,21 @@ def main():
 
     # Handle subcommands
     if args.command in ['manifest', 'run']:
-        if not args.no_banner:
+        from batch import expand
+        from runtime.events import make_sink
+
+        files = expand(args.files)
+        if args.daemon:
+            return run_daemon_client(files, args.events, args.quiet, use_cache=not args.no_cache,
+                                     write_ir=args.write_ir, jobs=1 if args.jobs is None else args.jobs)
+        if files != args.files or len(files) > 1:
+            return run_batch(files, args.events, args.quiet, args.jobs,
+                             write_ir=args.write_ir, use_cache=not args.no_cache)
+        events = "null" if args.quiet else args.events
+        if not args.no_banner and events == "tty":
             show_banner()
-        return run_file(args.file)
+        return run_file(files[0], write_ir=args.write_ir, use_cache=not args.no_cache,
+                        sink=make_sink(events), jobs=1 if args.jobs is None else args.jobs)
     
     if args.command == 'create':
         return create_qbet(args.file)
@@ -386,11 +564,17 @@ def main():
         return manifest_portal()
     
     if args.command == 'build':
-        return build_qb(args.file, args.out)
+        return build_qb(args.file, args.out, args.format)
 
     if args.command == 'doctor':
         return run_doctor()
 
+    if args.command == 'serve-kernel':
+        return run_kernel_daemon(args.socket, args.workers)
+
+    if args.command == 'clean':
+        return run_clean()
+
     if args.command == 'observe':
         return run_observation(args.all)
 
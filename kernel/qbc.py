@@ -0,0 +1,237 @@
+"""
+QBET Compact IR (.qbc)
+Binary encoding of lowered instruction streams.
+
+Layout (little-endian):
+
+    header   magic "QBC\\x01", u32 instruction count, u32 version string,
+             u32 source string, u64 string table offset
+    records  u32 payload length, u8 opcode, [u32 opcode string], value
+    strings  u32 count, (count + 1) u64 offsets, UTF-8 blob
+
+Opcodes of the canonical instruction set are single bytes; any other
+opcode is stored through the string table. Every string (opcodes, names,
+property keys and values) is stored once and referenced by index.
+Values are tagged: null, true, false, int, float, str, list and dict.
+"""
+
+import mmap
+import struct
+
+MAGIC = b"QBC\x01"
+HEADER = struct.Struct("<4sIIIQ")
+U8 = struct.Struct("<B")
+U32 = struct.Struct("<I")
+U64 = struct.Struct("<Q")
+I64 = struct.Struct("<q")
+F64 = struct.Struct("<d")
+
+OPCODES = {
+    "UNIVERSE": 1,
+    "ENTITY": 2,
+    "MANIFEST": 3,
+    "FLOW_TIME": 4,
+    "OBSERVE": 5,
+}
+OPCODE_NAMES = {code: name for name, code in OPCODES.items()}
+OP_NAMED = 0     # Opcode outside the table; its name follows as a string
+OP_RAW = 255     # Instruction that is not a plain {"t", "v"} pair
+
+NULL, TRUE, FALSE, INT, FLOAT, STR, LIST, DICT, BIGINT = range(9)
+
+class QBCError(Exception):
+    pass
+
+class QBCWriter:
+    """Encode instructions into an open, seekable binary file"""
+
+    def __init__(self, file):
+        self.file = file
+        self.strings = {}
+        self.count = 0
+
+    def intern(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def write(self, instructions, version, source):
+        self.file.write(HEADER.pack(MAGIC, 0, 0, 0, 0))
+        for instr in instructions:
+            record = self.encode_instruction(instr)
+            self.file.write(U32.pack(len(record)))
+            self.file.write(record)
+            self.count += 1
+
+        version_index = self.intern(version)
+        source_index = self.intern(source)
+        table_offset = self.file.tell()
+        self.write_strings()
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.count, version_index, source_index, table_offset))
+        self.file.seek(0, 2)
+        return self.count
+
+    def write_strings(self):
+        blobs = [text.encode("utf-8") for text in self.strings]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        self.file.write(U32.pack(len(blobs)))
+        self.file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        self.file.write(b"".join(blobs))
+
+    def encode_instruction(self, instr):
+        out = bytearray()
+        if isinstance(instr, dict) and instr.keys() == {"t", "v"} and isinstance(instr["t"], str):
+            code = OPCODES.get(instr["t"])
+            if code is None:
+                out += U8.pack(OP_NAMED)
+                out += U32.pack(self.intern(instr["t"]))
+            else:
+                out += U8.pack(code)
+            self.encode_value(instr["v"], out)
+        else:
+            out += U8.pack(OP_RAW)
+            self.encode_value(instr, out)
+        return bytes(out)
+
+    def encode_value(self, value, out):
+        if value is None:
+            out += U8.pack(NULL)
+        elif value is True:
+            out += U8.pack(TRUE)
+        elif value is False:
+            out += U8.pack(FALSE)
+        elif isinstance(value, int):
+            if -(1 << 63) <= value < (1 << 63):
+                out += U8.pack(INT)
+                out += I64.pack(value)
+            else:
+                out += U8.pack(BIGINT)
+                out += U32.pack(self.intern(str(value)))
+        elif isinstance(value, float):
+            out += U8.pack(FLOAT)
+            out += F64.pack(value)
+        elif isinstance(value, str):
+            out += U8.pack(STR)
+            out += U32.pack(self.intern(value))
+        elif isinstance(value, (list, tuple)):
+            out += U8.pack(LIST)
+            out += U32.pack(len(value))
+            for item in value:
+                self.encode_value(item, out)
+        elif isinstance(value, dict):
+            out += U8.pack(DICT)
+            out += U32.pack(len(value))
+            for key, item in value.items():
+                out += U32.pack(self.intern(str(key)))
+                self.encode_value(item, out)
+        else:
+            raise QBCError(f"Cannot encode {type(value).__name__} in .qbc")
+
+class QBCReader:
+    """Memory-mapped .qbc file, decoded one record at a time"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise QBCError(f"{path} is empty, not a .qbc file")
+        magic, self.count, version_index, source_index, self.table = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise QBCError(f"{path} is not a .qbc file")
+        (self.string_count,) = U32.unpack_from(self.data, self.table)
+        self.offsets = self.table + U32.size
+        self.blob = self.offsets + (self.string_count + 1) * U64.size
+        self.strings = {}
+        self.version = self.string(version_index)
+        self.source = self.string(source_index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if getattr(self, "data", None) is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
+
+    def string(self, index):
+        text = self.strings.get(index)
+        if text is None:
+            start, end = struct.unpack_from("<QQ", self.data, self.offsets + index * U64.size)
+            text = self.strings[index] = self.data[self.blob + start:self.blob + end].decode("utf-8")
+        return text
+
+    def __iter__(self):
+        pos = HEADER.size
+        while pos < self.table:
+            (length,) = U32.unpack_from(self.data, pos)
+            pos += U32.size
+            yield self.decode_instruction(pos)
+            pos += length
+
+    def decode_instruction(self, pos):
+        code = self.data[pos]
+        pos += 1
+        if code == OP_RAW:
+            return self.decode_value(pos)[0]
+        if code == OP_NAMED:
+            (index,) = U32.unpack_from(self.data, pos)
+            op = self.string(index)
+            pos += U32.size
+        else:
+            op = OPCODE_NAMES[code]
+        return {"t": op, "v": self.decode_value(pos)[0]}
+
+    def decode_value(self, pos):
+        """Return (value, position after the value)"""
+        data = self.data
+        tag = data[pos]
+        pos += 1
+        if tag == STR:
+            return self.string(U32.unpack_from(data, pos)[0]), pos + U32.size
+        if tag == LIST:
+            (length,) = U32.unpack_from(data, pos)
+            pos += U32.size
+            items = []
+            for _ in range(length):
+                item, pos = self.decode_value(pos)
+                items.append(item)
+            return items, pos
+        if tag == DICT:
+            (length,) = U32.unpack_from(data, pos)
+            pos += U32.size
+            items = {}
+            for _ in range(length):
+                key = self.string(U32.unpack_from(data, pos)[0])
+                items[key], pos = self.decode_value(pos + U32.size)
+            return items, pos
+        if tag == NULL:
+            return None, pos
+        if tag == TRUE:
+            return True, pos
+        if tag == FALSE:
+            return False, pos
+        if tag == INT:
+            return I64.unpack_from(data, pos)[0], pos + I64.size
+        if tag == FLOAT:
+            return F64.unpack_from(data, pos)[0], pos + F64.size
+        if tag == BIGINT:
+            return int(self.string(U32.unpack_from(data, pos)[0])), pos + U32.size
+        raise QBCError(f"Corrupt .qbc value tag {tag} at offset {pos - 1}")
+
+def write_qbc(file, instructions, version, source):
+    """Write instructions to an open binary file in the .qbc layout"""
+    return QBCWriter(file).write(instructions, version, source)
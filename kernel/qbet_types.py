@@ -15,6 +15,7 @@ class QBETType(Enum):
     
     # Quantum types
     QUBIT = auto()
+    REGISTER = auto()
     WAVE = auto()
     PARTICLE = auto()
     MATRIX = auto()
@@ -84,15 +85,60 @@ class Null(QBETValue):
 class Qubit(QBETValue):
     """Quantum bit with superposition"""
     def __init__(self, alpha=1.0, beta=0.0):
-        self.alpha = alpha  # Probability amplitude for |0⟩
-        self.beta = beta    # Probability amplitude for |1⟩
+        # Sets alpha, the amplitude for |0⟩, and beta, for |1⟩
         super().__init__({'alpha': alpha, 'beta': beta}, QBETType.QUBIT)
     
-    def measure(self):
-        """Collapse to classical bit"""
+    @property
+    def value(self):
+        # Built from alpha/beta on access so it never goes stale after a gate
+        return {'alpha': self.alpha, 'beta': self.beta}
+    
+    @value.setter
+    def value(self, value):
+        self.alpha = value['alpha']
+        self.beta = value['beta']
+    
+    def measure(self, rng=None):
+        """Collapse to classical bit, drawing from `rng` (default: the random module)"""
         import random
         prob_zero = abs(self.alpha) ** 2
-        return 0 if random.random() < prob_zero else 1
+        return 0 if (rng or random).random() < prob_zero else 1
+
+    def sample(self, shots, rng=None):
+        """{'0': n0, '1': n1} for `shots` measurements, without collapsing"""
+        from stdlib.sampling import binomial
+        return binomial(1 - abs(self.alpha) ** 2, shots, rng)  # As in measure()
+
+class QubitRef(QBETValue):
+    """A qubit stored in a multi-qubit backend (see stdlib.statevector).
+
+    The quantum stdlib forwards gates to it by name instead of updating
+    alpha/beta itself.
+    """
+    def __init__(self, register, index):
+        self.register = register
+        self.index = index
+        super().__init__({'register': register, 'index': index}, QBETType.QUBIT)
+
+    def apply(self, gate):
+        """Apply the stdlib gate named `gate` ('h', 'x', 'y', 'z')"""
+        self.register.apply(gate, self.index)
+        return self
+
+    def measure(self):
+        """Collapse this qubit in its register and return 0 or 1"""
+        return self.register.measure(self.index)
+
+    def probability(self, bit):
+        """Probability of measuring `bit`, without collapsing"""
+        return self.register.probability(self.index, bit)
+
+    def sample(self, shots):
+        """{'0': n0, '1': n1} for `shots` measurements, without collapsing"""
+        return self.register.sample(shots, (self.index,))
+
+    def __str__(self):
+        return f"{self.register}[{self.index}]"
 
 class Chakra(QBETValue):
     """Chakra energy center"""
@@ -0,0 +1,78 @@
+"""
+QBET Resolver
+Static pass that assigns lexical addresses to variable references.
+"""
+
+from ast_nodes import *
+
+class Resolver:
+    """Annotates Identifier, Assignment and Measurement nodes with (depth, slot).
+
+    Every name assigned inside a function body gets a slot in that
+    function's frame, and FunctionDeclaration.frame_size records how many
+    slots to allocate. Functions see their own locals and the globals only,
+    so resolved addresses always have depth 0. Global names and names a
+    function reads without assigning stay unresolved (slot None) and are
+    looked up dynamically in the dict-based Environment, as is a local
+    read before its first assignment.
+    """
+
+    def __init__(self):
+        self.scopes = []   # One {name: slot} per enclosing function
+
+    def resolve(self, program):
+        self.resolve_node(program)
+        program.resolved = True
+        return program
+
+    def resolve_node(self, node):
+        method = getattr(self, f'resolve_{type(node).__name__}', None)
+        if method is not None:
+            method(node)
+
+    def resolve_Program(self, node):
+        for stmt in node.statements:
+            self.resolve_node(stmt)
+
+    def resolve_Block(self, node):
+        for stmt in node.statements:
+            self.resolve_node(stmt)
+
+    def resolve_FunctionDeclaration(self, node):
+        scope = {}
+        for name in self.assigned_names(node.body):
+            scope.setdefault(name, len(scope))
+        self.scopes.append(scope)
+        self.resolve_node(node.body)
+        self.scopes.pop()
+        node.frame_size = len(scope)
+
+    def resolve_ExpressionStatement(self, node):
+        self.resolve_node(node.expression)
+
+    def resolve_Assignment(self, node):
+        self.resolve_node(node.value)
+        self.address(node, node.name)
+
+    def resolve_FunctionCall(self, node):
+        for arg in node.arguments:
+            self.resolve_node(arg)
+
+    def resolve_QubitCreation(self, node):
+        self.resolve_node(node.alpha)
+
+    def resolve_Measurement(self, node):
+        self.address(node, node.qubit)
+
+    def resolve_Identifier(self, node):
+        self.address(node, node.name)
+
+    def address(self, node, name):
+        if self.scopes and name in self.scopes[-1]:
+            node.depth = 0
+            node.slot = self.scopes[-1][name]
+
+    def assigned_names(self, block):
+        for stmt in block.statements:
+            if isinstance(stmt, Assignment):
+                yield stmt.name
@@ -0,0 +1,203 @@
+"""
+QBET Runtime Events
+Pluggable sinks for the records emitted by the pipeline and interpreter.
+
+An event is a tuple (kind, *fields); FIELDS names the fields of each kind.
+Producers check `sink.enabled` before building an event, so nothing is
+formatted when output is discarded.
+"""
+
+import json
+
+from runtime.io import BufferedWriter
+
+# ANSI Colors
+GREEN = "\033[38;5;46m"
+CYAN = "\033[38;5;51m"
+RED = "\033[31m"
+DIM = "\033[2m"
+RESET = "\033[0m"
+
+FIELDS = {
+    # Pipeline
+    "lower": ("source", "target"),
+    "cached": ("source",),
+    "bind": ("target", "contract"),
+    "execute": ("target",),
+    "error": ("message",),
+    "file_result": ("file", "passed", "seconds"),
+    "batch_summary": ("files", "passed", "failed", "seconds", "jobs"),
+    # IR instructions
+    "laws": ("count",),
+    "universe": ("name", "props"),
+    "entity": ("name", "props"),
+    "manifest": ("universe", "entity"),
+    "flow_time": ("direction",),
+    "observe": ("target", "coherent"),
+    "unknown_opcode": ("op",),
+    # AST execution
+    "print": ("text",),
+    "link": ("qubit1", "qubit2"),
+    "collapse": ("name", "value"),
+    "stable": ("name",),
+    "state": ("name", "value"),
+}
+
+def event_from_record(record):
+    """Inverse of JSONLinesSink: rebuild the event tuple from its JSON object"""
+    kind = record["event"]
+    return (kind,) + tuple(record[field] for field in FIELDS[kind])
+
+class NullSink:
+    """Discards everything"""
+
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+class TTYSink:
+    """Renders events as the human-readable, ANSI-coloured console output"""
+
+    enabled = True
+
+    def __init__(self, writer=None):
+        self.writer = writer or BufferedWriter(batch=1)
+
+    def emit(self, event):
+        getattr(self, f"render_{event[0]}")(*event[1:])
+
+    def flush(self):
+        self.writer.flush()
+
+    def write(self, line):
+        self.writer.write(line)
+
+    def render_lower(self, source, target):
+        if target is None:
+            self.write(f"{DIM}🔄 Lowering {source} (in-memory){RESET}")
+        else:
+            self.write(f"{DIM}🔄 Lowering {source} -> {target}{RESET}")
+
+    def render_cached(self, source):
+        self.write(f"{DIM}⚡ Reusing cached IR for {source}{RESET}")
+
+    def render_bind(self, target, contract):
+        self.write(f"{DIM}🔗 Binding {target} to {contract}...{RESET}")
+
+    def render_execute(self, target):
+        self.write(f"{CYAN}🚀 Manifesting {target}...{RESET}")
+
+    def render_error(self, message):
+        self.write(f"{RED}❌ {message}{RESET}")
+
+    def render_file_result(self, file, passed, seconds):
+        if passed:
+            self.write(f"{DIM}✅ {file} ({seconds * 1000:.1f} ms){RESET}")
+        else:
+            self.write(f"{RED}❌ {file} ({seconds * 1000:.1f} ms){RESET}")
+
+    def render_batch_summary(self, files, passed, failed, seconds, jobs):
+        color = GREEN if not failed else RED
+        self.write(f"{color}📊 {files} files: {passed} passed, {failed} failed "
+                   f"in {seconds:.2f}s ({jobs} worker{'s' if jobs != 1 else ''}){RESET}")
+
+    def render_laws(self, count):
+        self.write(f"{DIM}⚖️  Enforcing {count} Sovereign Laws...{RESET}")
+
+    def render_universe(self, name, props):
+        self.write(f"🌌 Manifesting Universe: {name}")
+        for pk, pv in props.items():
+            self.write(f"  {DIM}property {pk}: {pv}{RESET}")
+
+    def render_entity(self, name, props):
+        self.write(f"👤 Defining Entity: {name}")
+        for pk, pv in props.items():
+            self.write(f"  {DIM}{pk}: {pv}{RESET}")
+
+    def render_manifest(self, universe, entity):
+        self.write(f"✨ Manifesting {universe} with {entity}...")
+
+    def render_flow_time(self, direction):
+        self.write(f"⏳ Flowing time {direction}...")
+
+    def render_observe(self, target, coherent):
+        self.write(f"👁️  Observing {target}... Status: STABLE")
+        if coherent:
+            self.write(f"  {DIM}Reality coherence: 0.9999{RESET}")
+
+    def render_unknown_opcode(self, op):
+        self.write(f"Warning: Unknown operational primitive {op}")
+
+    def render_print(self, text):
+        self.write(text)
+
+    def render_link(self, qubit1, qubit2):
+        self.write(f"🔗 Linking {qubit1} and {qubit2} in quantum entanglement...")
+
+    def render_collapse(self, name, value):
+        self.write(f"🌀 Observing {name}... Probability wave collapsed.")
+        self.write(f"✨ Result: {value}")
+
+    def render_stable(self, name):
+        self.write(f"✨ Observing {name}... Result: STABLE")
+
+    def render_state(self, name, value):
+        self.write(f"👁️  Observing {name}... State: {value}")
+
+class JSONLinesSink:
+    """Writes one JSON object per event, e.g. {"event": "manifest", ...}"""
+
+    enabled = True
+
+    def __init__(self, stream=None, batch=1024):
+        self.writer = BufferedWriter(stream, batch)
+
+    def emit(self, event):
+        record = {"event": event[0]}
+        record.update(zip(FIELDS[event[0]], event[1:]))
+        self.writer.write(json.dumps(record, ensure_ascii=False, default=str))
+
+    def flush(self):
+        self.writer.flush()
+
+class RecordingSink:
+    """Keeps events in memory as (key, event) pairs.
+
+    Callers set `key` to correlate events with whatever produced them,
+    e.g. the index of the instruction being executed.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.key = None
+        self.events = []
+
+    def emit(self, event):
+        self.events.append((self.key, event))
+
+    def flush(self):
+        pass
+
+    def take(self):
+        """Return the recorded events and start a new recording"""
+        events, self.events = self.events, []
+        return events
+
+SINKS = {
+    "tty": TTYSink,
+    "jsonl": JSONLinesSink,
+    "null": NullSink,
+}
+
+def make_sink(kind, batch=1024):
+    """Sink for a --events choice, batching output for whole-file runs"""
+    if kind == "tty":
+        return TTYSink(BufferedWriter(batch=batch))
+    if kind == "jsonl":
+        return JSONLinesSink(batch=batch)
+    return NullSink()
@@ -0,0 +1,31 @@
+"""
+QBET Runtime I/O
+Batched line output for the interpreter.
+"""
+
+import sys
+
+class BufferedWriter:
+    """Collects output lines and writes them to the stream in batches.
+
+    With batch=1 every line is written immediately. The stream defaults to
+    whatever sys.stdout is at flush time.
+    """
+
+    def __init__(self, stream=None, batch=1024):
+        self.stream = stream
+        self.batch = batch
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if not self.lines:
+            return
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(self.lines) + "\n")
+        self.lines.clear()
+        stream.flush()
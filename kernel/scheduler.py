@@ -0,0 +1,156 @@
+"""
+QBET Scheduler
+Runs the independent universes of a lowered program on a process pool.
+"""
+
+import os
+import pickle
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+from interpreter import Interpreter
+from errors import QBETError
+from runtime.events import RecordingSink, NullSink
+
+# Batches handed out per worker, so uneven universes still balance
+BATCHES_PER_JOB = 4
+
+def referenced_names(instr):
+    """Universe and entity names an IR instruction defines or reads"""
+    op, v = instr["t"], instr["v"]
+    if op in ("UNIVERSE", "ENTITY"):
+        return (v[0],)
+    if op == "MANIFEST":
+        return tuple(v)
+    if op == "OBSERVE":
+        return (v,)
+    return ()
+
+def components(instructions):
+    """Group instruction indices into independent subgraphs.
+
+    Instructions that share a name, directly or transitively, land in the
+    same component. Instructions that name nothing (FLOW_TIME, unknown
+    primitives) form components of their own. Components are ordered by
+    their first instruction and list their indices in source order.
+    """
+    parent = {}
+
+    def find(name):
+        root = name
+        while parent[root] != root:
+            root = parent[root]
+        while parent[name] != root:
+            parent[name], name = root, parent[name]
+        return root
+
+    owners = []
+    for instr in instructions:
+        names = referenced_names(instr)
+        for name in names:
+            parent.setdefault(name, name)
+        if names:
+            root = find(names[0])
+            for name in names[1:]:
+                other = find(name)
+                if other != root:
+                    parent[other] = root
+        owners.append(names[0] if names else None)
+
+    groups = {}
+    for index, name in enumerate(owners):
+        key = find(name) if name is not None else (None, index)
+        groups.setdefault(key, []).append(index)
+    return list(groups.values())
+
+def batches(groups, count):
+    """Split components into at most `count` runs of similar instruction counts"""
+    target = max(1, -(-sum(map(len, groups)) // count))
+    batch, size = [], 0
+    for group in groups:
+        batch.append(group)
+        size += len(group)
+        if size >= target:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+# Per-process interpreter, created by the pool initializer
+worker = None
+
+def init_worker(record):
+    global worker
+    worker = Interpreter(sink=RecordingSink() if record else NullSink())
+
+def run_batch(batch):
+    """Execute components in a worker.
+
+    `batch` is a list of components, each a list of (index, instruction).
+    Returns the recorded (index, event) pairs and an (index, exception)
+    pair for every component stopped by an error.
+    """
+    sink = worker.sink
+    failures = []
+    for component in batch:
+        worker.reset()
+        for index, instr in component:
+            sink.key = index
+            try:
+                worker.execute_instruction(instr)
+            except Exception as e:
+                failures.append((index, portable(e)))
+                break
+    return (sink.take() if sink.enabled else []), failures
+
+def portable(error):
+    """`error` in a form that survives pickling back to the parent"""
+    if isinstance(error, QBETError):
+        # Subclasses take other constructor arguments; keep the message
+        return QBETError(str(error))
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return QBETError(f"{type(error).__name__}: {error}")
+    return error
+
+class Scheduler:
+    """Executes lowered IR with independent universes run in parallel.
+
+    The output is the same as running the instructions one by one: events
+    are merged back in source order, and if an instruction fails, the
+    events up to the earliest failure are emitted before its error is
+    raised.
+    """
+
+    def __init__(self, jobs=None, sink=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.sink = sink or NullSink()
+
+    def run(self, instructions):
+        instructions = list(instructions)
+        groups = components(instructions)
+        if self.jobs <= 1 or len(groups) < 2:
+            interpreter = Interpreter(sink=self.sink)
+            for instr in instructions:
+                interpreter.execute_instruction(instr)
+            return
+
+        work = [[[(index, instructions[index]) for index in group] for group in batch]
+                for batch in batches(groups, self.jobs * BATCHES_PER_JOB)]
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker,
+                                 initargs=(self.sink.enabled,)) as pool:
+            results = list(pool.map(run_batch, work))
+
+        failures = [failure for _, batch_failures in results for failure in batch_failures]
+        first = min(failures, key=itemgetter(0)) if failures else None
+        stop = first[0] if first else len(instructions)
+        if self.sink.enabled:
+            events = sorted((pair for batch_events, _ in results for pair in batch_events),
+                            key=itemgetter(0))
+            for index, event in events:
+                if index > stop:
+                    break
+                self.sink.emit(event)
+        if first:
+            raise first[1]
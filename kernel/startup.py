@@ -0,0 +1,60 @@
+"""
+QBET Startup Profiler
+Reports where a `qb` invocation spends its startup time, module by module.
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+MAIN = Path(__file__).with_name("main.py")
+
+# ANSI Colors
+CYAN = "\033[38;5;51m"
+DIM = "\033[2m"
+RESET = "\033[0m"
+
+def measure(argv):
+    """Run `qb <argv>` under -X importtime -> (wall seconds, status, imports).
+
+    `imports` lists (module, depth, self_us, cumulative_us) in import order;
+    depth 0 marks modules imported directly rather than by another module.
+    """
+    command = [sys.executable, "-X", "importtime", str(MAIN), *argv]
+    start = time.perf_counter()
+    result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+    return wall, result.returncode, parse(result.stderr)
+
+def parse(report):
+    """Entries of a -X importtime report; other stderr lines are skipped"""
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column header
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return imports
+
+def profile(argv, limit=20):
+    """Print the startup profile of `qb <argv>`"""
+    wall, status, imports = measure(argv)
+    total = sum(entry[2] for entry in imports)
+    command = " ".join(["qb", *argv]) if argv else "qb"
+    print(f"{CYAN}⏱️  {command}: {wall * 1000:.1f} ms wall, "
+          f"{total / 1000:.1f} ms importing {len(imports)} modules{RESET}")
+    print(f"  {'cumulative (ms)':>15} {'self (ms)':>10}  module")
+    top = sorted((entry for entry in imports if entry[1] == 0), key=lambda entry: -entry[3])
+    for name, _, self_us, cumulative_us in top[:limit]:
+        print(f"  {cumulative_us / 1000:>15.2f} {self_us / 1000:>10.2f}  {name}")
+    if len(top) > limit:
+        print(f"  {DIM}... {len(top) - limit} more top-level imports{RESET}")
+    if status:
+        print(f"{DIM}(command exited with status {status}){RESET}")
+    return 0
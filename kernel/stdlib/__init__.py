@@ -1,7 +1,42 @@
-"""QBET Standard Library Initializer"""
+"""QBET Standard Library Initializer
 
-from stdlib.core import setup_core_functions
-from stdlib.quantum import setup_quantum_functions
-from stdlib.spiritual import setup_spiritual_functions
+Modules are imported on first `use`. Their bindings are set up once per
+interpreter, since some hold state (the quantum stdlib's lazy circuit and
+noise model) that must not leak between interpreters.
+"""
 
-__all__ = ['setup_core_functions', 'setup_quantum_functions', 'setup_spiritual_functions']
+import importlib
+
+from environment import Environment
+
+# `use` name -> (Python module, setup function)
+MODULES = {
+    'core': ('stdlib.core', 'setup_core_functions'),
+    'quantum': ('stdlib.quantum', 'setup_quantum_functions'),
+    'spiritual': ('stdlib.spiritual', 'setup_spiritual_functions'),
+    'tars': ('stdlib.tars', 'setup_tars'),
+}
+
+def load_module(name, cache):
+    """Bindings {name: value} for stdlib module `name`, or None if there is no such module.
+
+    `cache` is the caller's {name: bindings} dict; an interpreter passes its
+    own and clears it on reset.
+    """
+    if name not in cache:
+        if name not in MODULES:
+            return None
+        module, setup = MODULES[name]
+        env = Environment()
+        getattr(importlib.import_module(module), setup)(env)
+        cache[name] = env.variables
+    return cache[name]
+
+def __getattr__(attr):
+    # setup_* functions stay importable from here without eager imports
+    for module, setup in MODULES.values():
+        if setup == attr:
+            return getattr(importlib.import_module(module), setup)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+__all__ = ['load_module', 'setup_core_functions', 'setup_quantum_functions', 'setup_spiritual_functions']
@@ -0,0 +1,97 @@
+"""
+QBET Standard Library - Lazy Circuits
+Records single-qubit gates per qubit instead of applying them, and applies
+each qubit's run of gates as one fused 2x2 matrix when a result is needed.
+"""
+
+from qbet_types import *
+from stdlib.gates import GATES
+from stdlib.qubitarray import QubitArray
+
+# Gates that are their own inverse: two in a row cancel
+SELF_INVERSE = frozenset('hxyz')
+
+def multiply(a, b):
+    """2x2 matrix product a·b"""
+    (a00, a01), (a10, a11) = a
+    (b00, b01), (b10, b11) = b
+    return ((a00 * b00 + a01 * b10, a00 * b01 + a01 * b11),
+            (a10 * b00 + a11 * b10, a10 * b01 + a11 * b11))
+
+def fuse(gates):
+    """One matrix for `gates` applied first to last, or None if there are none"""
+    matrix = None
+    for gate in gates:
+        matrix = GATES[gate] if matrix is None else multiply(GATES[gate], matrix)
+    return matrix
+
+class Circuit:
+    """Pending gates per qubit, applied when the qubit is read.
+
+    Gates on different qubits commute, so reading one qubit only needs its
+    own pending gates, and a two-qubit gate only those of its two qubits.
+    Reading a whole register settles every qubit in it.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # (id(owner), index) -> (owner, index, [gate names]); owner is a
+        # Qubit or QubitArray (index None) or a register
+        self.pending = {}
+        self.recorded = 0  # Gates recorded
+        self.applied = 0   # Fused matrices actually applied
+
+    @staticmethod
+    def owner(qubit):
+        if isinstance(qubit, QubitRef):
+            return qubit.register, qubit.index
+        return qubit, None
+
+    def record(self, qubit, gate):
+        """Queue `gate` ('h', 'x', 'y', 'z') on a Qubit, QubitRef or
+        QubitArray; returns it"""
+        owner, index = self.owner(qubit)
+        key = (id(owner), index)
+        if key not in self.pending:
+            self.pending[key] = (owner, index, [])
+        gates = self.pending[key][2]
+        if gates and gates[-1] == gate and gate in SELF_INVERSE:
+            gates.pop()
+        else:
+            gates.append(gate)
+        self.recorded += 1
+        return qubit
+
+    def settle(self, *qubits):
+        """Apply the pending gates of `qubits` (qubits, qubit arrays or registers)"""
+        if not self.pending:
+            return
+        for qubit in qubits:
+            if isinstance(qubit, (Qubit, QubitRef, QubitArray)):
+                owner, index = self.owner(qubit)
+                entry = self.pending.pop((id(owner), index), None)
+                if entry:
+                    self.execute(*entry)
+            else:
+                for key in [key for key in self.pending if key[0] == id(qubit)]:
+                    self.execute(*self.pending.pop(key))
+
+    def run(self):
+        """Apply everything pending"""
+        pending, self.pending = self.pending, {}
+        for entry in pending.values():
+            self.execute(*entry)
+
+    def execute(self, owner, index, gates):
+        matrix = fuse(gates)
+        if matrix is None:
+            return
+        if isinstance(owner, Qubit):
+            (u00, u01), (u10, u11) = matrix
+            owner.alpha, owner.beta = (u00 * owner.alpha + u01 * owner.beta,
+                                       u10 * owner.alpha + u11 * owner.beta)
+        elif index is None:
+            owner.apply(matrix)
+        else:
+            owner.apply(matrix, index)
+        self.applied += 1
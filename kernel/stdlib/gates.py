@@ -0,0 +1,16 @@
+"""
+QBET Standard Library - Gates
+Single-qubit gate matrices shared by the quantum backends, as
+((u00, u01), (u10, u11)) acting on the amplitudes (|0⟩, |1⟩).
+"""
+
+import math
+
+SQRT1_2 = 1 / math.sqrt(2)
+
+GATES = {
+    'h': ((SQRT1_2, SQRT1_2), (SQRT1_2, -SQRT1_2)),
+    'x': ((0, 1), (1, 0)),
+    'y': ((0, -1j), (1j, 0)),
+    'z': ((1, 0), (0, -1)),
+}
@@ -0,0 +1,217 @@
+"""
+QBET Standard Library - Matrix Product State Register
+n-qubit register stored as a chain of small tensors (a tensor train), for
+circuits whose entanglement stays low, e.g. shallow nearest-neighbour
+circuits on 100+ qubits.
+"""
+
+from collections import Counter
+
+from qbet_types import *
+from errors import QBETError
+from stdlib.gates import GATES
+from stdlib.statevector import numpy
+
+# Largest bond dimension kept after a two-qubit gate
+MAX_BOND = 64
+
+# Singular values below this fraction of the largest are always dropped
+CUTOFF = 1e-12
+
+# Shots sampled together, bounding the (shots, bond) work arrays
+SAMPLE_CHUNK = 8192
+
+class MPS(QBETValue):
+    """Register of `size` qubits as tensors A[k] of shape (left, 2, right).
+
+    Qubit k is site k of the chain and bit k of a basis index, as in
+    StateVector. Single-qubit gates update one tensor exactly. A controlled
+    gate contracts two neighbouring tensors, applies the gate and splits
+    them again with an SVD that keeps at most `max_bond` singular values;
+    qubits further apart are first brought together with SWAPs and moved
+    back afterwards.
+
+    The weight of the singular values discarded by the cap is added to
+    `truncation` and multiplied out of `fidelity` (an estimate of the
+    overlap with the exact state), so callers can tell how much a bond cap
+    cost. Values under CUTOFF are dropped without being counted.
+    """
+
+    def __init__(self, size, max_bond=MAX_BOND, rng=None):
+        np = numpy()
+        self.size = size
+        self.max_bond = max_bond
+        self.rng = rng or np.random.default_rng()
+        zero = np.zeros((1, 2, 1), dtype=np.complex128)
+        zero[0, 0, 0] = 1
+        self.tensors = [zero.copy() for _ in range(size)]
+        # Every tensor left of the center is left-orthonormal and every
+        # tensor right of it right-orthonormal; the norm sits at the center
+        self.center = 0
+        self.truncation = 0.0
+        self.fidelity = 1.0
+        self.matrices = {}
+        super().__init__({'qubits': size}, QBETType.REGISTER)
+
+    def __str__(self):
+        return f"Register({self.size} qubits, MPS)"
+
+    def qubit(self, index):
+        if not 0 <= index < self.size:
+            raise QBETError(f"Qubit {index} is outside a {self.size}-qubit register")
+        return QubitRef(self, index)
+
+    def matrix(self, gate):
+        """2x2 complex matrix for a gate name or a nested-tuple matrix"""
+        np = numpy()
+        if isinstance(gate, str):
+            if gate not in self.matrices:
+                self.matrices[gate] = np.array(GATES[gate], dtype=np.complex128)
+            return self.matrices[gate]
+        return np.asarray(gate, dtype=np.complex128)
+
+    def bonds(self):
+        """Bond dimension between each pair of neighbouring qubits"""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def move_center(self, site):
+        """Shift the orthogonality center to `site` with QR decompositions"""
+        np = numpy()
+        tensors = self.tensors
+        while self.center < site:
+            k = self.center
+            left, _, right = tensors[k].shape
+            q, r = np.linalg.qr(tensors[k].reshape(left * 2, right))
+            tensors[k] = q.reshape(left, 2, -1)
+            tensors[k + 1] = np.tensordot(r, tensors[k + 1], axes=1)
+            self.center += 1
+        while self.center > site:
+            k = self.center
+            left, _, right = tensors[k].shape
+            q, r = np.linalg.qr(tensors[k].reshape(left, 2 * right).T)
+            tensors[k] = q.T.reshape(-1, 2, right)
+            tensors[k - 1] = np.tensordot(tensors[k - 1], r.T, axes=1)
+            self.center -= 1
+
+    def apply(self, gate, index, controls=()):
+        """Apply a single-qubit gate to qubit `index`, optionally with one control.
+
+        The gate must be unitary; move the center to `index` first to apply
+        a non-unitary operator, whose change of norm must stay at the center.
+        """
+        np = numpy()
+        u = self.matrix(gate)
+        if not controls:
+            self.tensors[index] = np.einsum('ij,ajb->aib', u, self.tensors[index])
+            return
+        if len(controls) > 1:
+            raise QBETError("MPS registers support at most one control qubit")
+        control = controls[0]
+        # Walk the control next to the target, apply, and walk it back
+        step = 1 if control < index else -1
+        path = range(control, index - step, step)
+        for site in path:
+            self.swap(min(site, site + step))
+        self.controlled(u, index - step, index)
+        for site in reversed(path):
+            self.swap(min(site, site + step))
+
+    def cnot(self, control, target):
+        self.apply('x', target, (control,))
+
+    def controlled(self, u, control, target):
+        """Controlled-u on neighbouring sites"""
+        np = numpy()
+        gate = np.zeros((2, 2, 2, 2), dtype=np.complex128)
+        gate[0, :, 0, :] = np.eye(2)
+        gate[1, :, 1, :] = u
+        if control > target:
+            gate = gate.transpose(1, 0, 3, 2)
+        self.two_site(gate, min(control, target))
+
+    def swap(self, site):
+        """Exchange the qubits on sites `site` and `site + 1`"""
+        np = numpy()
+        gate = np.eye(4, dtype=np.complex128).reshape(2, 2, 2, 2).transpose(1, 0, 2, 3)
+        self.two_site(gate, site)
+
+    def two_site(self, gate, site):
+        """Apply gate[i, j, i', j'] to sites (site, site + 1) and re-split them"""
+        np = numpy()
+        self.move_center(site)
+        a, b = self.tensors[site], self.tensors[site + 1]
+        left, right = a.shape[0], b.shape[2]
+        theta = np.tensordot(a, b, axes=1)                 # (l, i', j', r)
+        theta = np.einsum('ijkl,aklb->aijb', gate, theta)  # (l, i, j, r)
+        u, s, vh = np.linalg.svd(theta.reshape(left * 2, 2 * right), full_matrices=False)
+        weight = s ** 2
+        total = weight.sum()
+        significant = int(np.count_nonzero(s > CUTOFF * s[0]))
+        keep = min(significant, self.max_bond)
+        # Only the cap costs fidelity; values under CUTOFF are rounding noise
+        discarded = float(weight[keep:significant].sum() / total)
+        if discarded:
+            self.truncation += discarded
+            self.fidelity *= 1 - discarded
+        s = s[:keep] / np.sqrt(weight[:keep].sum() / total)
+        self.tensors[site] = u[:, :keep].reshape(left, 2, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, right)
+        self.center = site + 1
+
+    def probability(self, index, bit):
+        np = numpy()
+        self.move_center(index)
+        tensor = self.tensors[index]
+        total = np.vdot(tensor, tensor).real
+        half = tensor[:, bit, :]
+        return float(np.vdot(half, half).real / total)
+
+    def measure(self, index):
+        """Collapse qubit `index` and return the observed bit"""
+        np = numpy()
+        p1 = self.probability(index, 1)
+        bit = 1 if self.rng.random() < p1 else 0
+        tensor = self.tensors[index]
+        tensor[:, 1 - bit, :] = 0
+        tensor /= np.sqrt(np.vdot(tensor, tensor).real)
+        return bit
+
+    def sample(self, shots, qubits=None):
+        """{bitstring: count} for `shots` measurements of `qubits` (default
+        all) without collapsing the state; see StateVector.sample.
+
+        Qubits are drawn site by site from their conditional distribution,
+        for all shots at once.
+        """
+        np = numpy()
+        qubits = range(self.size) if qubits is None else qubits
+        self.move_center(0)
+        columns = list(reversed(qubits))
+        counts = Counter()
+        for start in range(0, shots, SAMPLE_CHUNK):
+            chunk = min(SAMPLE_CHUNK, shots - start)
+            bits = np.empty((chunk, self.size), dtype=np.uint8)
+            env = np.ones((chunk, 1), dtype=np.complex128)
+            for k, tensor in enumerate(self.tensors):
+                v0 = env @ tensor[:, 0, :]
+                v1 = env @ tensor[:, 1, :]
+                p0 = np.einsum('ij,ij->i', v0, v0.conj()).real
+                p1 = np.einsum('ij,ij->i', v1, v1.conj()).real
+                ones = self.rng.random(chunk) * (p0 + p1) < p1
+                bits[:, k] = ones
+                env = np.where(ones[:, None], v1 / np.sqrt(np.maximum(p1, 1e-300))[:, None],
+                               v0 / np.sqrt(np.maximum(p0, 1e-300))[:, None])
+            rows = np.ascontiguousarray(bits[:, columns] + ord('0')).view(f'S{len(columns)}').ravel()
+            outcomes, tally = np.unique(rows, return_counts=True)
+            counts.update(dict(zip((o.decode() for o in outcomes), tally.tolist())))
+        return dict(sorted(counts.items()))
+
+    def amplitudes(self):
+        """The full 2^n state as a NumPy vector (small registers only)"""
+        np = numpy()
+        state = np.ones((1, 1), dtype=np.complex128)
+        for tensor in reversed(self.tensors):
+            # state: (bond, 2^m) over this site and those to its right,
+            # this site being the lowest bit
+            state = np.einsum('aib,bs->asi', tensor, state).reshape(tensor.shape[0], -1)
+        return state.reshape(-1)
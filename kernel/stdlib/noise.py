@@ -0,0 +1,123 @@
+"""
+QBET Standard Library - Noise
+Depolarizing and amplitude-damping channels, applied after each gate as a
+random Kraus operator (one Monte Carlo trajectory per run). Averaging the
+counts of many runs reproduces the noisy statistics; see trajectories.py.
+"""
+
+import math
+import random
+
+from qbet_types import *
+from stdlib.gates import GATES
+from stdlib.statevector import numpy
+from stdlib.qubitarray import QubitArray
+from stdlib.mps import MPS
+
+PAULIS = ('x', 'y', 'z')
+
+class NoiseModel:
+    """Noise applied to every qubit a gate acts on.
+
+    depolarizing: probability that the gate is followed by an X, Y or Z
+    (chosen uniformly) on the qubit.
+    damping: amplitude-damping rate γ per gate, the chance that |1⟩
+    decays to |0⟩.
+
+    `rng` drives the channels and also seeds the registers the quantum
+    stdlib creates, so seeding it makes a whole run reproducible.
+    """
+
+    def __init__(self, depolarizing=0.0, damping=0.0, seed=None):
+        self.depolarizing = depolarizing
+        self.damping = damping
+        self.seed(seed)
+
+    def __repr__(self):
+        return f"NoiseModel(depolarizing={self.depolarizing}, damping={self.damping})"
+
+    @property
+    def active(self):
+        return bool(self.depolarizing or self.damping)
+
+    def seed(self, seed=None):
+        self.rng = random.Random(seed)
+        self.array_rng = None
+
+    def child_seed(self):
+        """A 64-bit seed for a register's own random stream"""
+        return self.rng.getrandbits(64)
+
+    def after(self, *qubits):
+        """Apply the channels to the qubits a gate just acted on"""
+        for qubit in qubits:
+            if isinstance(qubit, QubitArray):
+                if self.depolarizing:
+                    self.depolarize_array(qubit)
+                if self.damping:
+                    self.damp_array(qubit)
+                continue
+            if self.depolarizing and self.rng.random() < self.depolarizing:
+                apply_matrix(qubit, GATES[self.rng.choice(PAULIS)])
+            if self.damping:
+                self.damp(qubit)
+
+    def damp(self, qubit):
+        """Amplitude damping as a jump to |0⟩ (probability γ·P(1)) or the
+        renormalized no-jump operator diag(1, sqrt(1-γ))"""
+        p1 = probability_one(qubit)
+        if p1 <= 0:
+            return
+        jump = self.damping * p1
+        if self.rng.random() < jump:
+            apply_matrix(qubit, ((0, 1 / math.sqrt(p1)), (0, 0)))
+        else:
+            c = 1 / math.sqrt(1 - jump)
+            apply_matrix(qubit, ((c, 0), (0, c * math.sqrt(1 - self.damping))))
+
+    def generator(self):
+        """NumPy generator for qubit arrays, seeded from `rng`"""
+        if self.array_rng is None:
+            self.array_rng = numpy().random.default_rng(self.child_seed())
+        return self.array_rng
+
+    def depolarize_array(self, qubits):
+        np = numpy()
+        rng = self.generator()
+        hit = rng.random(qubits.size) < self.depolarizing
+        pauli = rng.integers(0, 3, qubits.size)
+        for k, name in enumerate(PAULIS):
+            where = np.flatnonzero(hit & (pauli == k))
+            (u00, u01), (u10, u11) = GATES[name]
+            a, b = qubits.alpha[where], qubits.beta[where]
+            qubits.alpha[where] = u00 * a + u01 * b
+            qubits.beta[where] = u10 * a + u11 * b
+
+    def damp_array(self, qubits):
+        np = numpy()
+        p0, p1 = qubits.probability(0), qubits.probability(1)
+        p1 /= p0 + p1
+        jump = self.damping * p1
+        hit = self.generator().random(qubits.size) < jump
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stay = 1 / np.sqrt(1 - jump)
+            qubits.alpha[...] = np.where(hit, qubits.beta / np.sqrt(p1), qubits.alpha * stay)
+        qubits.beta[...] = np.where(hit, 0, qubits.beta * stay * math.sqrt(1 - self.damping))
+
+def probability_one(qubit):
+    if isinstance(qubit, QubitRef):
+        return qubit.probability(1)
+    p0, p1 = abs(qubit.alpha) ** 2, abs(qubit.beta) ** 2
+    return p1 / (p0 + p1)
+
+def apply_matrix(qubit, matrix):
+    """Apply a 2x2 matrix to a Qubit or a register qubit"""
+    (u00, u01), (u10, u11) = matrix
+    if isinstance(qubit, QubitRef):
+        if isinstance(qubit.register, MPS):
+            # Kraus operators change the norm, which must sit at the center
+            qubit.register.move_center(qubit.index)
+        qubit.register.apply(matrix, qubit.index)
+    else:
+        qubit.alpha, qubit.beta = (u00 * qubit.alpha + u01 * qubit.beta,
+                                   u10 * qubit.alpha + u11 * qubit.beta)
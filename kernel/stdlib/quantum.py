@@ -4,14 +4,42 @@ Quantum computing metaphors and operations.
 """
 
 from qbet_types import *
+from stdlib.statevector import StateVector, numpy
+from stdlib.sparse import SparseState
+from stdlib.mps import MPS, MAX_BOND
+from stdlib.qubitarray import QubitArray
+from stdlib.circuit import Circuit
+from stdlib.noise import NoiseModel
 import random
 import math
 
+# Values the single-qubit gates accept
+QUBITS = (Qubit, QubitRef, QubitArray)
+
+# Multi-qubit register backends
+REGISTERS = (StateVector, SparseState, MPS)
+
 def setup_quantum_functions(env):
     """Register quantum built-in functions"""
     
+    # Gates recorded in lazy mode, applied fused when a qubit is read
+    circuit = Circuit()
+    
+    # Noise channels applied after each gate (inactive until noise_model)
+    noise = NoiseModel()
+    
+    def noisy(*qubits):
+        """The first of `qubits`, after the noise channels act on each"""
+        if noise.active:
+            noise.after(*qubits)
+        return qubits[0]
+    
     def hadamard(qubit):
         """Apply Hadamard gate (creates superposition)"""
+        if circuit.enabled and not noise.active and isinstance(qubit, QUBITS):
+            return circuit.record(qubit, 'h')
+        if isinstance(qubit, (QubitRef, QubitArray)):
+            return noisy(qubit.apply('h'))
         if not isinstance(qubit, Qubit):
             return Null()
         # H gate: |0⟩ -> (|0⟩ + |1⟩)/√2, |1⟩ -> (|0⟩ - |1⟩)/√2
@@ -20,40 +48,57 @@ def setup_quantum_functions(env):
         new_beta = (qubit.alpha - qubit.beta) / sqrt2
         qubit.alpha = new_alpha
         qubit.beta = new_beta
-        return qubit
+        return noisy(qubit)
     
     def pauli_x(qubit):
         """Apply Pauli-X gate (NOT gate)"""
+        if circuit.enabled and not noise.active and isinstance(qubit, QUBITS):
+            return circuit.record(qubit, 'x')
+        if isinstance(qubit, (QubitRef, QubitArray)):
+            return noisy(qubit.apply('x'))
         if not isinstance(qubit, Qubit):
             return Null()
         # X gate: swap |0⟩ and |1⟩
         qubit.alpha, qubit.beta = qubit.beta, qubit.alpha
-        return qubit
+        return noisy(qubit)
     
     def pauli_y(qubit):
         """Apply Pauli-Y gate"""
+        if circuit.enabled and not noise.active and isinstance(qubit, QUBITS):
+            return circuit.record(qubit, 'y')
+        if isinstance(qubit, (QubitRef, QubitArray)):
+            return noisy(qubit.apply('y'))
         if not isinstance(qubit, Qubit):
             return Null()
         # Y gate: |0⟩ -> i|1⟩, |1⟩ -> -i|0⟩
-        new_alpha = -qubit.beta
-        new_beta = qubit.alpha
+        new_alpha = -1j * qubit.beta
+        new_beta = 1j * qubit.alpha
         qubit.alpha = new_alpha
         qubit.beta = new_beta
-        return qubit
+        return noisy(qubit)
     
     def pauli_z(qubit):
         """Apply Pauli-Z gate"""
+        if circuit.enabled and not noise.active and isinstance(qubit, QUBITS):
+            return circuit.record(qubit, 'z')
+        if isinstance(qubit, (QubitRef, QubitArray)):
+            return noisy(qubit.apply('z'))
         if not isinstance(qubit, Qubit):
             return Null()
         # Z gate: |0⟩ -> |0⟩, |1⟩ -> -|1⟩
         qubit.beta = -qubit.beta
-        return qubit
+        return noisy(qubit)
     
     def measure_qubit(qubit):
         """Measure qubit (collapse to classical state)"""
+        circuit.settle(qubit)
+        if isinstance(qubit, QubitRef):
+            return Number(qubit.measure())
+        if isinstance(qubit, QubitArray):
+            return QBETValue(qubit.measure(), QBETType.ARRAY)
         if not isinstance(qubit, Qubit):
             return Null()
-        result = qubit.measure()
+        result = qubit.measure(noise.rng)
         # After measurement, qubit is in definite state
         if result == 0:
             qubit.alpha = 1.0
@@ -65,6 +110,15 @@ def setup_quantum_functions(env):
     
     def entangle_qubits(qubit1, qubit2):
         """Entangle two qubits (simplified)"""
+        circuit.settle(qubit1, qubit2)
+        if isinstance(qubit1, QubitRef) and isinstance(qubit2, QubitRef):
+            if qubit1.register is not qubit2.register:
+                return Null()
+            # Bell pair from |00⟩: H on the first, then CNOT onto the second
+            noisy(qubit1.apply('h'))
+            qubit1.register.cnot(qubit1.index, qubit2.index)
+            noisy(qubit1, qubit2)
+            return Boolean(True)
         if not isinstance(qubit1, Qubit) or not isinstance(qubit2, Qubit):
             return Null()
         # Simplified entanglement: make them correlated
@@ -77,10 +131,13 @@ def setup_quantum_functions(env):
     
     def superpose(qubit, alpha, beta):
         """Set qubit to specific superposition"""
-        if not isinstance(qubit, Qubit):
+        if not isinstance(qubit, (Qubit, QubitArray)):
             return Null()
+        circuit.settle(qubit)
         alpha_val = alpha.value if isinstance(alpha, Number) else alpha
         beta_val = beta.value if isinstance(beta, Number) else beta
+        if isinstance(qubit, QubitArray):
+            return qubit.superpose(alpha_val, beta_val)
         
         # Normalize
         norm = math.sqrt(alpha_val**2 + beta_val**2)
@@ -91,16 +148,141 @@ def setup_quantum_functions(env):
     
     def probability_zero(qubit):
         """Get probability of measuring |0⟩"""
+        circuit.settle(qubit)
+        if isinstance(qubit, QubitRef):
+            return Number(qubit.probability(0))
+        if isinstance(qubit, QubitArray):
+            return QBETValue(qubit.probability(0), QBETType.ARRAY)
         if not isinstance(qubit, Qubit):
             return Null()
         return Number(abs(qubit.alpha) ** 2)
     
     def probability_one(qubit):
         """Get probability of measuring |1⟩"""
+        circuit.settle(qubit)
+        if isinstance(qubit, QubitRef):
+            return Number(qubit.probability(1))
+        if isinstance(qubit, QubitArray):
+            return QBETValue(qubit.probability(1), QBETType.ARRAY)
         if not isinstance(qubit, Qubit):
             return Null()
         return Number(abs(qubit.beta) ** 2)
     
+    def sample(target, shots):
+        """Histogram of `shots` measurements of a qubit or register.
+        
+        Draws every shot at once from the outcome distribution; the state
+        is not collapsed. Returns {bitstring: count}, qubit 0 rightmost;
+        a qubit array gives its '0'/'1' totals over all of its qubits.
+        """
+        if not isinstance(target, (*QUBITS, *REGISTERS)):
+            return Null()
+        circuit.settle(target)
+        shots_val = int(shots.value) if isinstance(shots, Number) else int(shots)
+        if isinstance(target, Qubit):
+            counts = target.sample(shots_val, noise.rng)
+        else:
+            counts = target.sample(shots_val)
+        return QBETValue({bits: Number(n) for bits, n in counts.items()}, QBETType.OBJECT)
+    
+    def create_register(size, backend=None, max_bond=None):
+        """Create an n-qubit register, all qubits |0⟩.
+        
+        backend 'dense' is a NumPy state vector, 'sparse' stores only
+        non-zero amplitudes; by default the register starts sparse and
+        turns dense once enough amplitudes are non-zero. 'mps' is a
+        matrix product state for low-entanglement circuits on many qubits,
+        keeping at most `max_bond` singular values per bond (see
+        truncation_error).
+        """
+        size_val = int(size.value) if isinstance(size, Number) else int(size)
+        kind = backend.value if isinstance(backend, String) else backend
+        # Registers draw measurements from streams seeded by the noise
+        # model's generator, so quantum_seed makes a run reproducible
+        seed = noise.child_seed()
+        if kind == 'dense':
+            return StateVector(size_val, rng=numpy().random.default_rng(seed))
+        if kind == 'sparse':
+            return SparseState(size_val, rng=random.Random(seed), threshold=float('inf'))
+        if kind == 'mps':
+            bond_val = MAX_BOND if max_bond is None else (
+                int(max_bond.value) if isinstance(max_bond, Number) else int(max_bond))
+            return MPS(size_val, max_bond=bond_val, rng=numpy().random.default_rng(seed))
+        return SparseState(size_val, rng=random.Random(seed))
+    
+    def truncation_error(register):
+        """Total weight of the singular values an MPS register has discarded
+        to stay within its bond cap (0 for an exact state)"""
+        if not isinstance(register, MPS):
+            return Null()
+        circuit.settle(register)
+        return Number(register.truncation)
+    
+    def qubit_array(size):
+        """`size` independent qubits, all |0⟩, that every gate and
+        prob_zero/prob_one handle in bulk (NumPy complex128 arrays)"""
+        size_val = int(size.value) if isinstance(size, Number) else int(size)
+        return QubitArray(size_val, rng=numpy().random.default_rng(noise.child_seed()))
+    
+    def register_qubit(register, index):
+        """Handle to qubit `index` of a register, usable with every gate"""
+        if not isinstance(register, REGISTERS):
+            return Null()
+        index_val = int(index.value) if isinstance(index, Number) else int(index)
+        return register.qubit(index_val)
+    
+    def cnot(control, target):
+        """Controlled-NOT between two qubits of the same register"""
+        if not (isinstance(control, QubitRef) and isinstance(target, QubitRef)):
+            return Null()
+        if control.register is not target.register:
+            return Null()
+        circuit.settle(control, target)
+        control.register.cnot(control.index, target.index)
+        noisy(control, target)
+        return target
+    
+    def lazy_gates(enabled=True):
+        """Switch lazy circuit mode on or off.
+        
+        While on, hadamard/pauli_* only record the gate. Each qubit's gates
+        are fused into one matrix (with H·H, X·X, Y·Y, Z·Z pairs dropped)
+        and applied when the qubit is measured, read or observed, or at
+        run_circuit(). Switching off applies everything pending.
+        """
+        flag = enabled.value if isinstance(enabled, QBETValue) else enabled
+        circuit.enabled = bool(flag)
+        if not circuit.enabled:
+            circuit.run()
+        return Boolean(circuit.enabled)
+    
+    def run_circuit():
+        """Apply every gate recorded in lazy mode"""
+        circuit.run()
+        return Null()
+    
+    def noise_model(depolarizing=0, damping=0):
+        """Apply noise after every gate from now on: a random X/Y/Z with
+        probability `depolarizing`, and amplitude damping at rate `damping`.
+        
+        Each run is one random trajectory; trajectories.TrajectoryRunner
+        aggregates many. Lazy circuit mode is bypassed while noise is on.
+        noise_model(0, 0) switches noise off. Like the lazy circuit, the
+        model belongs to the interpreter that ran `use quantum` and is
+        dropped when it resets.
+        """
+        noise.depolarizing = float(depolarizing.value if isinstance(depolarizing, Number) else depolarizing)
+        noise.damping = float(damping.value if isinstance(damping, Number) else damping)
+        if noise.active:
+            circuit.run()
+        return Boolean(noise.active)
+    
+    def quantum_seed(seed):
+        """Seed the noise channels, single-qubit measurements and the
+        registers created afterwards"""
+        noise.seed(seed.value if isinstance(seed, QBETValue) else seed)
+        return Null()
+    
     def create_matrix(rows, cols, default=0):
         """Create matrix"""
         rows_val = int(rows.value) if isinstance(rows, Number) else 2
@@ -130,6 +312,16 @@ def setup_quantum_functions(env):
     env.define('superpose', superpose)
     env.define('prob_zero', probability_zero)
     env.define('prob_one', probability_one)
+    env.define('sample', sample)
+    env.define('register', create_register)
+    env.define('register_qubit', register_qubit)
+    env.define('truncation_error', truncation_error)
+    env.define('qubit_array', qubit_array)
+    env.define('cnot', cnot)
+    env.define('lazy_gates', lazy_gates)
+    env.define('run_circuit', run_circuit)
+    env.define('noise_model', noise_model)
+    env.define('quantum_seed', quantum_seed)
     env.define('create_matrix', create_matrix)
     env.define('wave_interference', wave_interference)
     env.define('particle_collision', particle_collision)
@@ -0,0 +1,86 @@
+"""
+QBET Standard Library - Qubit Arrays
+Ensembles of independent qubits stored as two complex128 NumPy arrays, so
+that a gate or a probability query covers every qubit in one operation.
+"""
+
+from qbet_types import *
+from stdlib.gates import GATES
+from stdlib.statevector import numpy, transform
+
+class QubitArray(QBETValue):
+    """`size` independent qubits, qubit k being alpha[k]|0⟩ + beta[k]|1⟩.
+
+    Every qubit starts in |0⟩. Gates apply to all of them at once, in
+    place; unlike Qubit there is no per-qubit Python object.
+    """
+
+    def __init__(self, size, rng=None):
+        np = numpy()
+        self.size = size
+        self.alpha = np.ones(size, dtype=np.complex128)
+        self.beta = np.zeros(size, dtype=np.complex128)
+        self.rng = rng or np.random.default_rng()
+        self.matrices = {}
+        self.scratch = None
+        super().__init__({'qubits': size}, QBETType.ARRAY)
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"QubitArray({self.size} qubits)"
+
+    def matrix(self, gate):
+        """2x2 complex matrix for a gate name or a nested-tuple matrix"""
+        np = numpy()
+        if isinstance(gate, str):
+            if gate not in self.matrices:
+                self.matrices[gate] = np.array(GATES[gate], dtype=np.complex128)
+            return self.matrices[gate]
+        return np.asarray(gate, dtype=np.complex128)
+
+    def copy(self, amplitudes):
+        """Copy of `amplitudes` in a scratch buffer reused across gates"""
+        np = numpy()
+        if self.scratch is None:
+            self.scratch = np.empty(self.size, dtype=np.complex128)
+        np.copyto(self.scratch, amplitudes)
+        return self.scratch
+
+    def apply(self, gate):
+        """Apply a single-qubit gate (name or 2x2 matrix) to every qubit"""
+        transform(self.alpha, self.beta, self.matrix(gate), self.copy)
+        return self
+
+    def superpose(self, alpha, beta):
+        """Set every qubit to alpha|0⟩ + beta|1⟩ (scalars or arrays), normalized"""
+        np = numpy()
+        self.alpha[...] = alpha
+        self.beta[...] = beta
+        norm = np.sqrt(self.probability(0) + self.probability(1))
+        np.divide(self.alpha, norm, out=self.alpha, where=norm > 0)
+        np.divide(self.beta, norm, out=self.beta, where=norm > 0)
+        return self
+
+    def probability(self, bit):
+        """Per-qubit probability of measuring `bit`, as a float64 array"""
+        amplitudes = self.beta if bit else self.alpha
+        return amplitudes.real ** 2 + amplitudes.imag ** 2
+
+    def measure(self):
+        """Collapse every qubit; returns the observed bits as a uint8 array"""
+        np = numpy()
+        p1 = self.probability(1)
+        bits = self.rng.random(self.size) * (self.probability(0) + p1) < p1
+        self.alpha[...] = ~bits
+        self.beta[...] = bits
+        return bits.astype(np.uint8)
+
+    def sample(self, shots):
+        """{'0': n0, '1': n1} totalled over `shots` measurements of every
+        qubit, without collapsing"""
+        p1 = self.probability(1)
+        p1 /= p1 + self.probability(0)
+        ones = int(self.rng.binomial(shots, p1).sum())
+        return {'0': shots * self.size - ones, '1': ones}
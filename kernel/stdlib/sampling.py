@@ -0,0 +1,59 @@
+"""
+QBET Standard Library - Sampling
+Multi-shot measurement statistics drawn in one vectorized step, without
+collapsing the state.
+
+Falls back to the random module when NumPy is not installed.
+"""
+
+import random
+from collections import Counter
+
+from errors import QBETError
+
+def generator(rng):
+    """A NumPy Generator for `rng`, or None when NumPy is not installed.
+
+    NumPy generators are used as they are; a random.Random seeds a new one
+    so that seeded runs stay reproducible.
+    """
+    if hasattr(rng, 'multinomial'):
+        return rng
+    from stdlib.statevector import numpy
+    try:
+        np = numpy()
+    except QBETError:
+        return None
+    return np.random.default_rng(rng.getrandbits(64))
+
+def draw(outcomes, weights, shots, rng):
+    """{outcome: count} for `shots` independent draws weighted by `weights`"""
+    np_rng = generator(rng)
+    if np_rng is None:
+        return Counter(rng.choices(outcomes, weights, k=shots))
+    from stdlib.statevector import np
+    p = np.asarray(weights, dtype=np.float64)
+    counts = np_rng.multinomial(shots, p / p.sum())
+    hits = np.flatnonzero(counts)
+    return dict(zip((outcomes[i] for i in hits.tolist()), counts[hits].tolist()))
+
+def project(index, qubits):
+    """Basis index -> index over `qubits` alone, qubits[0] as bit 0"""
+    result = 0
+    for bit, qubit in enumerate(qubits):
+        result |= (index >> qubit & 1) << bit
+    return result
+
+def bitstrings(counts, width):
+    """{index: count} -> {bitstring: count}, most significant bit first"""
+    return {format(index, f'0{width}b'): count for index, count in sorted(counts.items())}
+
+def binomial(p1, shots, rng=None):
+    """{'0': n0, '1': n1} for `shots` measurements of one qubit with P(1) = p1"""
+    rng = rng or random.Random()
+    np_rng = generator(rng)
+    if np_rng is None:
+        ones = sum(rng.random() < p1 for _ in range(shots))
+    else:
+        ones = int(np_rng.binomial(shots, min(max(p1, 0.0), 1.0)))
+    return {'0': shots - ones, '1': ones}
@@ -0,0 +1,159 @@
+"""
+QBET Standard Library - Sparse Register
+n-qubit register that stores only the non-zero amplitudes, for circuits
+that stay close to basis states (X/CNOT logic with few Hadamards).
+"""
+
+import math
+import random
+
+from qbet_types import *
+from errors import QBETError
+from stdlib.gates import GATES
+from stdlib.statevector import StateVector, numpy
+from stdlib.sampling import draw, project, bitstrings
+
+# Amplitudes smaller than this are dropped after a gate
+EPSILON = 1e-15
+
+# Fraction of the 2^n amplitudes that may be non-zero before the register
+# converts itself to a dense StateVector
+DENSE_THRESHOLD = 1 / 64
+
+class SparseState(QBETValue):
+    """Register of `size` qubits as a {basis index: amplitude} dict.
+
+    Qubit k is bit k of the basis index, as in StateVector. Once more than
+    `threshold` of the amplitudes are non-zero the register moves its state
+    into a StateVector and forwards every operation to it; handles to its
+    qubits stay valid. Without NumPy it stays sparse. Sizes beyond what a
+    dense vector could hold (e.g. 100 qubits of basis logic) are fine as
+    long as few amplitudes are non-zero.
+    """
+
+    def __init__(self, size, rng=None, threshold=DENSE_THRESHOLD):
+        self.size = size
+        self.terms = {0: 1 + 0j}
+        self.rng = rng or random.Random()
+        self.threshold = threshold
+        # Number of terms that triggers densify(). Past 60 qubits no dense
+        # vector fits in memory anyway, and threshold * 2^size would
+        # overflow a float for ~1024 qubits.
+        self.limit = math.inf if size > 60 else threshold * (1 << size)
+        self.dense = None
+        super().__init__({'qubits': size}, QBETType.REGISTER)
+
+    def __str__(self):
+        return f"Register({self.size} qubits)"
+
+    def qubit(self, index):
+        if not 0 <= index < self.size:
+            raise QBETError(f"Qubit {index} is outside a {self.size}-qubit register")
+        return QubitRef(self, index)
+
+    def apply(self, gate, index, controls=()):
+        """Apply a single-qubit gate to qubit `index`, optionally controlled"""
+        if self.dense is not None:
+            return self.dense.apply(gate, index, controls)
+        (u00, u01), (u10, u11) = GATES[gate] if isinstance(gate, str) else gate
+        bit = 1 << index
+        mask = 0
+        for control in controls:
+            mask |= 1 << control
+        terms = self.terms
+        new = {}
+        if u01 == 0 and u10 == 0:
+            # Diagonal: rescale, the support can only shrink
+            for key, amplitude in terms.items():
+                if key & mask == mask:
+                    amplitude *= u11 if key & bit else u00
+                    if abs(amplitude) <= EPSILON:
+                        continue
+                new[key] = amplitude
+            self.terms = new
+            return
+        if u00 == 0 and u11 == 0:
+            # Anti-diagonal: flip the bit, the support can only shrink
+            for key, amplitude in terms.items():
+                if key & mask == mask:
+                    amplitude *= u01 if key & bit else u10
+                    if abs(amplitude) <= EPSILON:
+                        continue
+                    key ^= bit
+                new[key] = amplitude
+        else:
+            for key, amplitude in terms.items():
+                if key & mask != mask:
+                    new[key] = amplitude
+                    continue
+                zero = key & ~bit
+                if key & bit and zero in terms:
+                    continue  # Pair already handled from its |0⟩ side
+                a0 = terms.get(zero, 0)
+                a1 = terms.get(zero | bit, 0)
+                b0 = u00 * a0 + u01 * a1
+                b1 = u10 * a0 + u11 * a1
+                if abs(b0) > EPSILON:
+                    new[zero] = b0
+                if abs(b1) > EPSILON:
+                    new[zero | bit] = b1
+        self.terms = new
+        if len(new) > self.limit:
+            self.densify()
+
+    def cnot(self, control, target):
+        self.apply('x', target, (control,))
+
+    def densify(self):
+        """Move the state into a StateVector, if NumPy is available"""
+        try:
+            np = numpy()
+        except QBETError:
+            return
+        dense = StateVector(self.size, rng=np.random.default_rng(self.rng.getrandbits(64)))
+        dense.state[0] = 0
+        dense.state[list(self.terms)] = list(self.terms.values())
+        self.dense = dense
+        self.terms = None
+
+    def probability(self, index, bit):
+        if self.dense is not None:
+            return self.dense.probability(index, bit)
+        flag = 1 << index
+        want = flag if bit else 0
+        return sum(abs(a) ** 2 for key, a in self.terms.items() if key & flag == want)
+
+    def measure(self, index):
+        """Collapse qubit `index` and return the observed bit"""
+        if self.dense is not None:
+            return self.dense.measure(index)
+        p1 = self.probability(index, 1)
+        bit = 1 if self.rng.random() < p1 else 0
+        flag = 1 << index
+        want = flag if bit else 0
+        norm = (p1 if bit else 1 - p1) ** 0.5
+        self.terms = {key: a / norm for key, a in self.terms.items() if key & flag == want}
+        return bit
+
+    def sample(self, shots, qubits=None):
+        """{bitstring: count} for `shots` measurements of `qubits` (default
+        all) without collapsing the state; see StateVector.sample.
+        """
+        if self.dense is not None:
+            return self.dense.sample(shots, qubits)
+        qubits = range(self.size) if qubits is None else qubits
+        weights = {}
+        for key, amplitude in self.terms.items():
+            outcome = project(key, qubits)
+            weights[outcome] = weights.get(outcome, 0) + abs(amplitude) ** 2
+        counts = draw(list(weights), list(weights.values()), shots, self.rng)
+        return bitstrings(counts, len(qubits))
+
+    def amplitudes(self):
+        """The full 2^n state as a NumPy vector"""
+        if self.dense is not None:
+            return self.dense.state
+        np = numpy()
+        state = np.zeros(1 << self.size, dtype=np.complex128)
+        state[list(self.terms)] = list(self.terms.values())
+        return state
@@ -0,0 +1,185 @@
+"""
+QBET Standard Library - State Vector Register
+n-qubit register backed by a NumPy complex128 state vector.
+
+NumPy is optional: it is imported when the first register is created.
+"""
+
+from qbet_types import *
+from errors import QBETError
+from stdlib.gates import GATES
+from stdlib.sampling import bitstrings
+
+np = None
+
+def numpy():
+    """The numpy module, imported on first use"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise QBETError("Quantum registers require NumPy (pip install numpy)")
+        np = numpy
+    return np
+
+def scale(amplitudes, factor):
+    if factor != 1:
+        amplitudes *= factor
+
+def transform(zero, one, matrix, copy):
+    """Apply a 2x2 `matrix` in place to amplitude arrays `zero` (|0⟩) and
+    `one` (|1⟩). `copy(array)` returns a scratch copy of `zero`.
+    """
+    (u00, u01), (u10, u11) = matrix.tolist()
+    if u01 == 0 and u10 == 0:
+        # Diagonal (Z, phases): scale each half
+        scale(zero, u00)
+        scale(one, u11)
+    elif u00 == 0 and u11 == 0:
+        # Anti-diagonal (X, Y): swap the halves, then apply the phases
+        a0 = copy(zero)
+        zero[...] = one
+        one[...] = a0
+        scale(zero, u01)
+        scale(one, u10)
+    else:
+        # zero = u00·a0 + u01·a1 computed as u01·((u00/u01)·a0 + a1),
+        # and likewise for one, so no product arrays are allocated
+        a0 = copy(zero)
+        if u01 == 0:
+            scale(zero, u00)
+        else:
+            scale(zero, u00 / u01)
+            zero += one
+            scale(zero, u01)
+        if u10 == 0:
+            scale(one, u11)
+        else:
+            scale(one, u11 / u10)
+            one += a0
+            scale(one, u10)
+
+class StateVector(QBETValue):
+    """Register of `size` qubits in a 2^size complex128 amplitude vector.
+
+    Qubit k is bit k of the basis-state index. Gates are applied in place
+    on a reshaped view of the vector in which the qubits involved have
+    their own axes, so a gate is a few whole-array operations with no
+    Python-level loop over amplitudes.
+    """
+
+    def __init__(self, size, rng=None):
+        np = numpy()
+        self.size = size
+        self.state = np.zeros(1 << size, dtype=np.complex128)
+        self.state[0] = 1.0
+        self.rng = rng or np.random.default_rng()
+        self.matrices = {}
+        self.scratch = None
+        super().__init__({'qubits': size}, QBETType.REGISTER)
+
+    def __str__(self):
+        return f"Register({self.size} qubits)"
+
+    def qubit(self, index):
+        if not 0 <= index < self.size:
+            raise QBETError(f"Qubit {index} is outside a {self.size}-qubit register")
+        return QubitRef(self, index)
+
+    def matrix(self, gate):
+        """2x2 complex matrix for a gate name or a nested-tuple matrix"""
+        if isinstance(gate, str):
+            if gate not in self.matrices:
+                self.matrices[gate] = np.array(GATES[gate], dtype=np.complex128)
+            return self.matrices[gate]
+        return np.asarray(gate, dtype=np.complex128)
+
+    def view(self, qubits):
+        """The state reshaped so that each of `qubits` has an axis of length 2.
+
+        Qubits between them are merged into single axes, keeping the view
+        low-dimensional; the axis of qubits[i] (in descending order) is 2i+1.
+        """
+        shape, upper = [], self.size
+        for qubit in sorted(qubits, reverse=True):
+            shape += [1 << (upper - qubit - 1), 2]
+            upper = qubit
+        shape.append(1 << upper)
+        return self.state.reshape(shape)
+
+    def halves(self, index, controls=()):
+        """Views of the amplitudes with qubit `index` = 0 and = 1 (controls all 1)"""
+        qubits = sorted((index, *controls), reverse=True)
+        psi = self.view(qubits)
+        key = [slice(None)] * psi.ndim
+        for axis, qubit in enumerate(qubits):
+            if qubit != index:
+                key[2 * axis + 1] = 1
+        target = 2 * qubits.index(index) + 1
+        key[target] = 0
+        zero = psi[tuple(key)]
+        key[target] = 1
+        return zero, psi[tuple(key)]
+
+    def copy_half(self, half):
+        """Copy of a half-size view in a scratch buffer reused across gates"""
+        if self.scratch is None:
+            self.scratch = np.empty(len(self.state) >> 1, dtype=np.complex128)
+        copy = self.scratch[:half.size].reshape(half.shape)
+        np.copyto(copy, half)
+        return copy
+
+    def apply(self, gate, index, controls=()):
+        """Apply a single-qubit gate to qubit `index`, optionally controlled.
+
+        Works in place: besides one scratch copy of the |0⟩ half, no
+        temporary arrays are allocated.
+        """
+        zero, one = self.halves(index, controls)
+        transform(zero, one, self.matrix(gate), self.copy_half)
+
+    def cnot(self, control, target):
+        self.apply('x', target, (control,))
+
+    def probability(self, index, bit):
+        amplitudes = self.halves(index)[bit]
+        return float(np.vdot(amplitudes, amplitudes).real)
+
+    def probabilities(self):
+        """Probability of every basis state"""
+        return np.abs(self.state) ** 2
+
+    def amplitudes(self):
+        return self.state
+
+    def marginal(self, qubits):
+        """Probabilities over `qubits` alone, indexed with qubits[0] as bit 0"""
+        probabilities = self.probabilities()
+        if list(qubits) == list(range(self.size)):
+            return probabilities
+        # Axis a of the (2,)*n tensor is qubit n-1-a
+        tensor = probabilities.reshape((2,) * self.size)
+        keep = sorted(self.size - 1 - q for q in qubits)
+        summed = tensor.sum(axis=tuple(a for a in range(self.size) if a not in keep))
+        order = [keep.index(self.size - 1 - q) for q in reversed(qubits)]
+        return summed.transpose(order).reshape(-1)
+
+    def sample(self, shots, qubits=None):
+        """{bitstring: count} for `shots` measurements of `qubits` (default
+        all), drawn at once from the probability distribution. The state is
+        not collapsed.
+        """
+        qubits = range(self.size) if qubits is None else qubits
+        p = self.marginal(qubits)
+        counts = self.rng.multinomial(shots, p / p.sum())
+        hits = np.flatnonzero(counts)
+        return bitstrings(dict(zip(hits.tolist(), counts[hits].tolist())), len(qubits))
+
+    def measure(self, index):
+        """Collapse qubit `index` and return the observed bit"""
+        p1 = self.probability(index, 1)
+        bit = 1 if self.rng.random() < p1 else 0
+        self.halves(index)[1 - bit][...] = 0
+        self.state /= np.sqrt(p1 if bit else 1 - p1)
+        return bit
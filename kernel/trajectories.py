@@ -0,0 +1,104 @@
+"""
+QBET Trajectory Runner
+Runs many Monte Carlo noise trajectories of a quantum-stdlib program on a
+pool of worker processes and aggregates their measurement counts.
+"""
+
+import os
+import random
+from collections import Counter
+
+from errors import QBETError
+from qbet_types import QBETValue
+from environment import Environment
+
+# Trajectories per task. Each task has its own seed, so a fixed size makes
+# the counts for a given seed independent of the number of workers.
+BATCH_SIZE = 64
+
+def streams(seed, count):
+    """`count` independent 64-bit seeds derived from `seed`.
+
+    Uses NumPy's SeedSequence.spawn when available, whose children are
+    statistically independent streams; otherwise a random.Random.
+    """
+    from stdlib.statevector import numpy
+    try:
+        np = numpy()
+    except QBETError:
+        source = random.Random(seed)
+        return [source.getrandbits(64) for _ in range(count)]
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+def tally(counts, outcome):
+    """Add one trajectory's result: a histogram (e.g. from sample) is
+    merged, anything else counts as a single outcome"""
+    if isinstance(outcome, QBETValue):
+        outcome = outcome.value
+    if isinstance(outcome, dict):
+        for key, count in outcome.items():
+            counts[key] += int(count.value if isinstance(count, QBETValue) else count)
+    else:
+        counts[outcome] += 1
+
+def quantum_stdlib(noise):
+    """Fresh quantum stdlib bindings with the noise model applied"""
+    from stdlib.quantum import setup_quantum_functions
+    env = Environment()
+    setup_quantum_functions(env)
+    env.variables['noise_model'](noise.depolarizing, noise.damping)
+    return env.variables
+
+# Set in each worker process by init_worker: (trajectory, quantum stdlib bindings)
+_worker = None
+
+def init_worker(trajectory, noise):
+    """Give a worker process its own quantum stdlib"""
+    global _worker
+    _worker = (trajectory, quantum_stdlib(noise))
+
+def run_batch(task, worker=None):
+    """Run `count` trajectories from one seed; returns their Counter"""
+    seed, count = task
+    trajectory, quantum = worker or _worker
+    # Seeds the noise, the registers and single-qubit measurements alike
+    quantum['quantum_seed'](seed)
+    counts = Counter()
+    for _ in range(count):
+        tally(counts, trajectory(quantum))
+    return counts
+
+class TrajectoryRunner:
+    """Runs `trajectory(quantum)` many times under a NoiseModel.
+
+    `trajectory` receives the quantum stdlib bindings ({name: function}),
+    builds and measures its circuit, and returns an outcome (e.g. a
+    bitstring) or a histogram. Batches of trajectories run on `jobs`
+    processes, each batch with its own seed spawned from `seed`, and the
+    counts are summed. With jobs=1 everything runs in this process. On
+    platforms that spawn workers, `trajectory` must be importable
+    (defined at module level).
+    """
+
+    def __init__(self, noise, jobs=None, seed=None):
+        self.noise = noise
+        self.jobs = jobs or os.cpu_count() or 1
+        self.seed = seed
+
+    def run(self, trajectory, count):
+        """{outcome: count} over `count` trajectories, sorted by outcome"""
+        seeds = streams(self.seed, -(-count // BATCH_SIZE))
+        tasks = [(seed, min(BATCH_SIZE, count - i * BATCH_SIZE)) for i, seed in enumerate(seeds)]
+        if self.jobs <= 1 or len(tasks) < 2:
+            worker = (trajectory, quantum_stdlib(self.noise))
+            results = (run_batch(task, worker) for task in tasks)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker,
+                                     initargs=(trajectory, self.noise)) as pool:
+                results = list(pool.map(run_batch, tasks))
+        counts = Counter()
+        for batch in results:
+            counts.update(batch)
+        return dict(sorted(counts.items()))
@@ -0,0 +1,93 @@
+"""
+QBET Virtual Machine
+Dispatch loop for bytecode produced by compiler.Compiler.
+"""
+
+from compiler import *
+from environment import Environment, UNBOUND
+from interpreter import QuantumState, measurement_event, call_builtin, run_circuit
+from runtime.events import TTYSink
+import stdlib
+
+class VM:
+    """Runs compiled Code with the observable behaviour of Interpreter.
+
+    As Interpreter.visit_Program does, running a program first registers
+    all of its compiled declarations (Code.functions), so a function can
+    be called before the statement that declares it.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink or TTYSink()
+        self.env = Environment()
+        self.globals = self.env
+        self.functions = {}
+        self.modules = {}
+
+    def run(self, code):
+        if not code.is_function:
+            # Declarations are callable from anywhere in the program
+            self.functions.update(code.functions)
+        instructions = code.code
+        constants = code.constants
+        variables = self.globals.variables
+        globals_get = self.globals.get
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        local_slots = [UNBOUND] * len(code.slots)
+        sink = self.sink
+        pc = 0
+
+        while True:
+            op = instructions[pc]
+            arg = instructions[pc + 1]
+            pc += 2
+
+            if op == LOAD_CONST:
+                push(constants[arg])
+            elif op == LOAD_GLOBAL:
+                push(globals_get(constants[arg]))
+            elif op == STORE_GLOBAL:
+                variables[constants[arg]] = pop()
+            elif op == POP:
+                pop()
+            elif op == LOAD_FAST:
+                value = local_slots[arg]
+                push(globals_get(code.slots[arg]) if value is UNBOUND else value)
+            elif op == STORE_FAST:
+                local_slots[arg] = pop()
+            elif op == PRINT:
+                if sink.enabled:
+                    sink.emit(("print", " ".join([str(value) for value in stack[len(stack) - arg:]])))
+                del stack[len(stack) - arg:]
+                push(None)
+            elif op == MEASURE:
+                run_circuit(self.globals)
+                if sink.enabled:
+                    sink.emit(measurement_event(constants[arg], stack[-1]))
+            elif op == MAKE_QUBIT:
+                push(QuantumState(pop()))
+            elif op == ENTANGLE:
+                if sink.enabled:
+                    sink.emit(("link", *constants[arg]))
+                push(None)
+            elif op == CALL:
+                name, argc = constants[arg]
+                args = stack[len(stack) - argc:]
+                del stack[len(stack) - argc:]
+                push(self.call(name, args))
+            elif op == RETURN:
+                return None
+            elif op == IMPORT:
+                bindings = stdlib.load_module(constants[arg], self.modules)
+                if bindings:
+                    variables.update(bindings)
+                push(None)
+
+    def call(self, name, args):
+        if name not in self.functions:
+            return call_builtin(self.globals, name, args)
+        function = self.functions[name]
+        # Arguments are evaluated but not bound, as in the tree walker
+        return self.run(function)